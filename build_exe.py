@@ -3,33 +3,53 @@ Build script for creating standalone .exe using PyInstaller
 Run this script to build the distribution package for clients.
 """
 import PyInstaller.__main__
+import argparse
+import glob
 import os
 import shutil
 import sys
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
-def clean_previous_builds():
-    """Remove previous build artifacts"""
+# Folder mode starts much faster than --onefile, which unpacks the whole
+# bundle into a temp dir on every launch. Set PRMIGRATION_ONEFILE=1 to get a
+# single self-extracting exe instead.
+ONEFILE = os.getenv('PRMIGRATION_ONEFILE', '').lower() in ('true', '1', 'yes')
+
+def clean_previous_builds(fresh: bool = False):
+    """
+    Remove previous build artifacts
+    
+    build/ holds PyInstaller's analysis cache and is kept so rebuilds are
+    incremental; it is only removed for a fresh build.
+    """
     print("=" * 70)
     print("CLEANING PREVIOUS BUILDS")
     print("=" * 70)
     
-    folders_to_clean = ['build', 'dist', '__pycache__']
+    folders_to_clean = ['dist', '__pycache__']
+    if fresh:
+        folders_to_clean.insert(0, 'build')
+    
+    existing = [folder for folder in folders_to_clean if os.path.exists(folder)]
+    for folder in existing:
+        print(f"Removing {folder}/...")
     
-    for folder in folders_to_clean:
-        if os.path.exists(folder):
-            print(f"Removing {folder}/...")
-            shutil.rmtree(folder)
+    # The trees are independent, so delete them concurrently; list() surfaces
+    # any failure (e.g. a locked exe in dist/) instead of building over it
+    if existing:
+        with ThreadPoolExecutor(max_workers=len(existing)) as executor:
+            list(executor.map(shutil.rmtree, existing))
     
     # Remove .spec files
-    for file in os.listdir('.'):
-        if file.endswith('.spec'):
-            print(f"Removing {file}...")
-            os.remove(file)
+    for file in glob.glob('*.spec'):
+        print(f"Removing {file}...")
+        os.remove(file)
     
     print("✅ Cleanup complete\n")
 
 
-def build_executable():
+def build_executable(fresh: bool = False):
     """Build the executable using PyInstaller"""
     print("=" * 70)
     print("BUILDING EXECUTABLE")
@@ -38,7 +58,7 @@ def build_executable():
     # PyInstaller configuration
     pyinstaller_args = [
         'main.py',                          # Main script
-        '--onefile',                         # Single executable file
+        '--onefile' if ONEFILE else '--onedir',  # Folder build (fast startup) unless single file requested
         '--name=PRMigrationTool',           # Output name
         '--console',                         # Keep console window
         
@@ -46,18 +66,16 @@ def build_executable():
         '--add-data=config.template.yaml;.',
         '--add-data=user_mapping.template.yaml;.',
         
-        # Hidden imports (dependencies that PyInstaller might miss)
-        '--hidden-import=yaml',
+        # Hidden imports (dependencies that PyInstaller might miss). urllib3
+        # comes in through the requests hook and github through
+        # --collect-submodules below, so neither is listed here.
         '--hidden-import=requests',
-        '--hidden-import=github',
-        '--hidden-import=dateutil',
-        '--hidden-import=dateutil.parser',
         '--hidden-import=tenacity',
-        '--hidden-import=urllib3',
         
-        # Collect all submodules
-        '--collect-all=github',
-        '--collect-all=yaml',
+        # Collect code-only submodules (PyGithub's REST client ships no data
+        # files we need, so --collect-all would only add dead weight)
+        '--collect-submodules=github',
+        '--collect-submodules=yaml',         # Includes yaml._yaml (libyaml CSafeLoader)
         
         # Exclude unnecessary heavy packages
         '--exclude-module=torch',
@@ -88,17 +106,29 @@ def build_executable():
         '--exclude-module=pythoncom',
         '--exclude-module=pywintypes',
         '--exclude-module=lxml',
+        # Stdlib / packaging tooling that nothing imports at runtime
+        '--exclude-module=unittest',
+        '--exclude-module=pydoc',
+        '--exclude-module=xmlrpc',
+        '--exclude-module=test',
+        '--exclude-module=distutils',
+        '--exclude-module=setuptools',
+        '--exclude-module=pip',
         
         # Optimization
         '--noconfirm',                       # Replace output without confirmation
-        '--clean',                           # Clean cache before building
+        '--optimize=2',                      # Bundle -OO bytecode (no asserts/docstrings)
+        '--noupx',                           # Never UPX-pack DLLs (decompressed on every launch)
         
         # Optional: Add icon (uncomment if you have an icon file)
         # '--icon=app.ico',
     ]
     
+    if fresh:
+        pyinstaller_args.append('--clean')   # Discard the analysis cache
+    
     print("\nRunning PyInstaller with configuration:")
-    print(f"  - Single file mode: ✅")
+    print(f"  - Build mode: {'single file' if ONEFILE else 'folder (fast startup)'}")
     print(f"  - Console mode: ✅")
     print(f"  - Output name: PRMigrationTool.exe")
     print(f"  - Including templates: config.template.yaml, user_mapping.template.yaml")
@@ -109,10 +139,16 @@ def build_executable():
         print("\n" + "=" * 70)
         print("✅ BUILD SUCCESSFUL!")
         print("=" * 70)
-        print(f"\nExecutable location: {os.path.abspath('dist/PRMigrationTool.exe')}")
-        print("\nNext steps:")
-        print("  1. Test the executable: cd dist && PRMigrationTool.exe")
-        print("  2. Package for client: Copy dist/PRMigrationTool.exe + USAGE.txt")
+        if ONEFILE:
+            print(f"\nExecutable location: {os.path.abspath('dist/PRMigrationTool.exe')}")
+            print("\nNext steps:")
+            print("  1. Test the executable: cd dist && PRMigrationTool.exe")
+            print("  2. Package for client: Copy dist/PRMigrationTool.exe + USAGE.txt")
+        else:
+            print(f"\nExecutable location: {os.path.abspath('dist/PRMigrationTool/PRMigrationTool.exe')}")
+            print("\nNext steps:")
+            print("  1. Test the executable: cd dist/PRMigrationTool && PRMigrationTool.exe")
+            print("  2. Package for client: Copy the dist/PRMigrationTool folder + USAGE.txt")
         print("=" * 70)
         
     except Exception as e:
@@ -120,63 +156,75 @@ def build_executable():
         sys.exit(1)
 
 
-def create_distribution_folder():
-    """Create a distribution folder with all files needed for client"""
+def create_distribution_package():
+    """Write the zip file the client receives, straight from the build output"""
     print("\n" + "=" * 70)
     print("CREATING DISTRIBUTION PACKAGE")
     print("=" * 70)
     
-    dist_folder = 'client_distribution'
-    
-    if os.path.exists(dist_folder):
-        shutil.rmtree(dist_folder)
+    package = 'PRMigrationTool.zip'
     
-    os.makedirs(dist_folder)
+    # (source path, path inside the zip)
+    entries = []
     
-    # Copy executable
+    # Executable (single exe, or the whole application folder)
     exe_path = 'dist/PRMigrationTool.exe'
-    if os.path.exists(exe_path):
-        shutil.copy(exe_path, dist_folder)
-        print(f"✅ Copied: PRMigrationTool.exe")
-    
-    # Copy usage instructions
-    if os.path.exists('USAGE.txt'):
-        shutil.copy('USAGE.txt', dist_folder)
-        print(f"✅ Copied: USAGE.txt")
-    
-    # Copy templates (optional - for reference)
-    if os.path.exists('config.template.yaml'):
-        shutil.copy('config.template.yaml', dist_folder)
-        print(f"✅ Copied: config.template.yaml (reference)")
-    
-    if os.path.exists('user_mapping.template.yaml'):
-        shutil.copy('user_mapping.template.yaml', dist_folder)
-        print(f"✅ Copied: user_mapping.template.yaml (reference)")
-    
-    print(f"\n✅ Distribution package created in: {os.path.abspath(dist_folder)}")
+    app_folder = 'dist/PRMigrationTool'
+    if ONEFILE and os.path.exists(exe_path):
+        entries.append((exe_path, 'PRMigrationTool.exe'))
+    elif not ONEFILE and os.path.isdir(app_folder):
+        for root, _, files in os.walk(app_folder):
+            for name in files:
+                path = os.path.join(root, name)
+                entries.append((path, os.path.relpath(path, 'dist')))
+    
+    # Usage instructions and templates (optional - for reference)
+    for name in ('USAGE.txt', 'config.template.yaml', 'user_mapping.template.yaml'):
+        if os.path.exists(name):
+            entries.append((name, name))
+    
+    # Zip directly instead of copying everything into a staging folder first
+    with zipfile.ZipFile(package, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as archive:
+        for path, arcname in entries:
+            archive.write(path, arcname)
+    
+    print(f"\n✅ Distribution package created: {os.path.abspath(package)} ({os.path.getsize(package):,} bytes)")
     print("\nContents:")
-    for item in os.listdir(dist_folder):
-        size = os.path.getsize(os.path.join(dist_folder, item))
-        print(f"  - {item} ({size:,} bytes)")
+    if not ONEFILE and os.path.isdir(app_folder):
+        print(f"  - PRMigrationTool/ (application folder)")
+    for _, arcname in entries:
+        if '/' not in arcname.replace(os.sep, '/'):
+            print(f"  - {arcname}")
     
     print("\n" + "=" * 70)
     print("READY FOR CLIENT DELIVERY")
     print("=" * 70)
-    print(f"\nZip the '{dist_folder}' folder and send to your client.")
+    print(f"\nSend '{package}' to your client.")
     print("Client only needs to:")
     print("  1. Extract the zip file")
-    print("  2. Run PRMigrationTool.exe")
+    if ONEFILE:
+        print("  2. Run PRMigrationTool.exe")
+    else:
+        print("  2. Run PRMigrationTool\\PRMigrationTool.exe")
     print("  3. Enter their credentials when prompted")
     print("=" * 70)
 
 
 def main():
     """Main build process"""
+    parser = argparse.ArgumentParser(description="Build PRMigrationTool with PyInstaller")
+    parser.add_argument(
+        '--fresh',
+        action='store_true',
+        help='Full clean build: remove build/ and discard the PyInstaller cache'
+    )
+    args = parser.parse_args()
+    
     print("\n" + "=" * 70)
     print("  BITBUCKET TO GITHUB PR MIGRATION - BUILD SCRIPT")
     print("=" * 70)
     print("\nThis script will:")
-    print("  1. Clean previous builds")
+    print(f"  1. Clean previous builds{' (fresh build, cache discarded)' if args.fresh else ''}")
     print("  2. Build standalone .exe with PyInstaller")
     print("  3. Create distribution package for client")
     print("\n" + "=" * 70)
@@ -189,13 +237,13 @@ def main():
     print()
     
     # Step 1: Clean
-    clean_previous_builds()
+    clean_previous_builds(fresh=args.fresh)
     
     # Step 2: Build
-    build_executable()
+    build_executable(fresh=args.fresh)
     
     # Step 3: Create distribution package
-    create_distribution_folder()
+    create_distribution_package()
     
     print("\n🎉 ALL DONE! 🎉\n")
 
@@ -2,24 +2,155 @@
 Bitbucket API client for fetching pull requests
 """
 import requests
+import atexit
+import dbm
+import glob
+import hashlib
+import json
 import logging
+import math
+import os
+import shelve
+import sys
+import threading
+from collections import deque
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import List, Optional
-from dateutil import parser
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
+from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from tenacity import retry, stop_after_attempt, wait_random_exponential, retry_if_exception
 from models import PullRequest, PRComment, PRReviewer, PRTask
 
+try:
+    # orjson parses the raw response bytes several times faster than stdlib json
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 
 logger = logging.getLogger(__name__)
 
 
+def _json(response: requests.Response):
+    """Decode a JSON response body straight from its bytes"""
+    return _json_loads(response.content)
+
+
+# Shared read-only default for missing nested objects, instead of allocating
+# a throwaway {} for every .get() on every record
+_EMPTY: Mapping = MappingProxyType({})
+
+
+def _page_fields(*value_fields: str) -> str:
+    """
+    Build a 'fields' filter for a paginated endpoint
+    
+    The pagination keys are always kept; _iter_paginated needs 'next' to follow
+    pages and 'size'/'pagelen' to fetch the remaining ones concurrently.
+    """
+    return ','.join(('next', 'size', 'pagelen', 'page') + tuple(f'values.{field}' for field in value_fields))
+
+
+_USER_FIELDS = ('nickname', 'display_name', 'account_id')
+
+# Only the keys the parsers below read, instead of full objects with
+# rendered HTML, avatars and links
+PR_LIST_FIELDS = _page_fields(
+    'id', 'title', 'description', 'state', 'task_count',
+    'created_on', 'updated_on', 'closed_on',
+    *(f'author.{field}' for field in _USER_FIELDS),
+    'source.branch.name', 'source.repository.full_name', 'source.commit.hash',
+    'destination.branch.name', 'destination.repository.full_name',
+    'merge_commit.hash',
+    # Inline reviewers/participants so _parse_pull_request needn't refetch each PR
+    *(f'reviewers.{field}' for field in _USER_FIELDS),
+    *(f'participants.user.{field}' for field in _USER_FIELDS),
+    'participants.role', 'participants.approved', 'participants.state'
+)
+COMMENT_FIELDS = _page_fields(
+    'id', 'content.raw', 'created_on', 'updated_on', 'parent.id',
+    'inline.path', 'inline.from', 'inline.to', 'links.attachments.href',
+    *(f'user.{field}' for field in _USER_FIELDS)
+)
+COMMIT_FIELDS = _page_fields('hash')
+TASK_FIELDS = _page_fields(
+    'id', 'content.raw', 'state', 'created_on', 'updated_on', 'comment.id',
+    *(f'creator.{field}' for field in _USER_FIELDS)
+)
+
+
+# fromisoformat only accepts a 'Z' suffix from Python 3.11 on
+_FROMISOFORMAT_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Full jitter, so workers that failed together don't all retry in lockstep
+_jittered_backoff = wait_random_exponential(multiplier=1, max=60)
+
+# Throttling and overload responses, retried by _get rather than the adapter
+# so the wait can follow Retry-After or fall back to jittered backoff
+_THROTTLED_STATUSES = frozenset({429, 503})
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Transport failures, plus 429/503 responses; any other HTTP error is final"""
+    if isinstance(error, requests.exceptions.HTTPError):
+        return error.response is not None and error.response.status_code in _THROTTLED_STATUSES
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+def _retry_wait(retry_state) -> float:
+    """Wait as long as a 429/503 response's Retry-After asks, else back off with jitter"""
+    response = getattr(retry_state.outcome.exception(), 'response', None)
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return min(float(retry_after), 300.0)
+    return _jittered_backoff(retry_state)
+
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(value: str) -> datetime:
+    """
+    Parse a Bitbucket ISO-8601 timestamp (e.g. 2024-01-02T03:04:05.678901+00:00)
+    
+    Memoized: the same timestamps recur across PRs, comments and tasks, and
+    datetimes are immutable so sharing them is safe.
+    """
+    if _FROMISOFORMAT_ACCEPTS_Z:
+        return datetime.fromisoformat(value)
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
 class BitbucketClient:
     """Client for interacting with Bitbucket REST API 2.0"""
     
     BASE_URL = "https://api.bitbucket.org/2.0"
     OAUTH_TOKEN_URL = "https://bitbucket.org/site/oauth2/access_token"
+    MAX_WORKERS = 8  # Concurrent PR detail fetches (I/O bound)
+    PARSE_WINDOW = MAX_WORKERS * 4  # PRs parsed ahead of a streaming consumer
+    MAX_CONCURRENT_REQUESTS = 32  # In-flight API calls across all workers (= connection pool size)
+    REQUEST_TIMEOUT = (10, 30)  # (connect, read) seconds - a stalled socket must not hold a worker forever
+    PR_STATES = ('OPEN', 'MERGED', 'DECLINED', 'SUPERSEDED')
+    PAGELEN = 50  # Bitbucket's maximum page size for pull requests (default is 10)
+    CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'prmigration', 'bitbucket_cache')
+    TOKEN_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'prmigration', 'oauth_tokens.json')
+    
+    # OAuth tokens live ~2 hours, so share them between clients and runs
+    # instead of requesting a new one per client: "key:sha256(secret)" -> (token, expires_at)
+    _TOKEN_CACHE: Dict[str, Tuple[str, datetime]] = {}
+    _TOKEN_CACHE_LOCK = threading.Lock()
+    # A cached token is only reused with at least this much life left: the image
+    # migrator is handed the token once at startup and never refreshes it
+    TOKEN_MIN_LIFETIME = timedelta(minutes=30)
+    
+    # Workspaces whose plan refused attachment access (402). The plan applies to
+    # the whole workspace, so every client in this run skips those requests.
+    _ATTACHMENTS_UNSUPPORTED: set = set()
     
-    def __init__(self, workspace: str, repository: str, oauth_key: str = None, oauth_secret: str = None, token: str = None):#type: ignore
+    def __init__(self, workspace: str, repository: str, oauth_key: str = None, oauth_secret: str = None, token: str = None, use_cache: bool = True, pagelen: int = PAGELEN):#type: ignore
         """
         Initialize Bitbucket client
         
@@ -29,18 +160,54 @@ class BitbucketClient:
             oauth_key: OAuth Consumer Key (for OAuth 2.0 client credentials)
             oauth_secret: OAuth Consumer Secret (for OAuth 2.0 client credentials)
             token: Bitbucket API token (Bearer token) - alternative to OAuth
+            use_cache: Revalidate responses cached by earlier runs with ETags
+                instead of downloading them again
+            pagelen: Items per page for paginated endpoints (capped at PAGELEN)
         """
         self.workspace = workspace
         self.repository = repository
+        # Fewer, larger pages mean fewer round trips; Bitbucket rejects more than 50
+        self.pagelen = max(1, min(int(pagelen), self.PAGELEN))
         self.session = requests.Session()
+        # Keep enough keep-alive connections for every concurrent page and PR
+        # fetch, so workers reuse TLS connections instead of queueing for one.
+        # Only brief gateway errors are retried here, with jitter; connection
+        # errors, timeouts and 429/503 are left to _get's retry so a single
+        # layer retries each failure.
+        self.session.mount('https://', HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=self.MAX_CONCURRENT_REQUESTS,
+            max_retries=Retry(
+                total=3,
+                connect=0,
+                read=0,
+                backoff_factor=0.5,
+                backoff_jitter=0.5,
+                status_forcelist=[502, 504],
+                raise_on_status=False
+            )
+        ))
         self.oauth_key = oauth_key
         self.oauth_secret = oauth_secret
         self.access_token = None
         self.token_expires_at = None
+        self._token_lock = threading.Lock()  # Worker threads share one token
+        # PR workers each fan out page fetches, so cap the total in flight
+        self._request_slots = threading.BoundedSemaphore(self.MAX_CONCURRENT_REQUESTS)
+        # Per-PR child fetches (comments/commits/tasks). Kept apart from the PR
+        # pool: a PR worker blocks on these, so sharing its pool could deadlock.
+        self._detail_executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS * 3)
+        # Read-ahead of the next page for cursor-only endpoints. Page fetches
+        # never wait on other work, so this pool cannot deadlock.
+        self._page_executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+        self._cache = self._open_cache() if use_cache else None
+        self._reviewer_cache: Dict[tuple, PRReviewer] = {}  # Reviewers recur across PRs; share the instances
+        self._cache_lock = threading.Lock()  # shelve is not thread-safe
         
         # Use OAuth credentials if provided, otherwise use Bearer token
         if oauth_key and oauth_secret:
-            self._refresh_oauth_token()
+            if not self._load_cached_token():
+                self._refresh_oauth_token()
         elif token:
             self.access_token = token
             self.session.headers.update({
@@ -53,22 +220,31 @@ class BitbucketClient:
             'Accept': 'application/json'
         })
     
+    def _open_cache(self) -> Optional[shelve.Shelf]:
+        """
+        Open the on-disk response cache (URL -> (validators, body)) shared across runs
+        
+        The cached bodies are private repository content, so the cache files are
+        user-only (0600), including ones left with looser modes by older versions.
+        """
+        try:
+            os.makedirs(os.path.dirname(self.CACHE_PATH), mode=0o700, exist_ok=True)
+            cache = shelve.Shelf(dbm.open(self.CACHE_PATH, 'c', 0o600))
+            # dbm backends add their own suffixes (.db, .dat/.dir/.bak, ...)
+            for path in glob.glob(glob.escape(self.CACHE_PATH) + '*'):
+                os.chmod(path, 0o600)
+        except Exception as e:
+            logger.warning(f"Response cache unavailable, fetching everything fresh: {e}")
+            return None
+        atexit.register(cache.close)
+        return cache
+    
     def _refresh_oauth_token(self):
         """Get or refresh OAuth 2.0 access token using client credentials flow"""
         try:
-            response = requests.post(
-                self.OAUTH_TOKEN_URL,
-                auth=(self.oauth_key, self.oauth_secret),
-                data={'grant_type': 'client_credentials'}
+            self.access_token, self.token_expires_at, expires_in = self._request_token(
+                self.oauth_key, self.oauth_secret, self.session
             )
-            response.raise_for_status()
-            
-            token_data = response.json()
-            self.access_token = token_data['access_token']
-            expires_in = token_data.get('expires_in', 7200)  # Default 2 hours
-            
-            # Set expiration time (subtract 60 seconds buffer)
-            self.token_expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
             
             # Update session with new token
             self.session.headers.update({
@@ -81,18 +257,151 @@ class BitbucketClient:
             logger.error(f"Failed to get OAuth access token: {e}")
             raise
     
+    @classmethod
+    def get_oauth_token(cls, oauth_key: str, oauth_secret: str,
+                        session: Optional[requests.Session] = None,
+                        use_cached: bool = True) -> str:
+        """
+        Access token for an OAuth consumer, reusing one cached by any client or earlier run
+        
+        Args:
+            oauth_key: OAuth Consumer Key
+            oauth_secret: OAuth Consumer Secret
+            session: Session to request a new token with (a one-off request if None)
+            use_cached: Reuse a cached token; pass False to make Bitbucket check the credentials
+            
+        Returns:
+            Bearer access token
+            
+        Raises:
+            requests.exceptions.HTTPError: If Bitbucket rejects the consumer credentials
+        """
+        if use_cached:
+            cached = cls._cached_token(oauth_key, oauth_secret)
+            if cached is not None:
+                return cached[0]
+        return cls._request_token(oauth_key, oauth_secret, session or requests)[0]
+    
+    @classmethod
+    def _request_token(cls, oauth_key: str, oauth_secret: str, session) -> Tuple[str, datetime, int]:
+        """POST the client credentials grant and cache the result: (token, expires_at, expires_in)"""
+        response = session.post(
+            cls.OAUTH_TOKEN_URL,
+            auth=(oauth_key, oauth_secret),
+            data={'grant_type': 'client_credentials'},
+            timeout=cls.REQUEST_TIMEOUT
+        )
+        response.raise_for_status()
+        
+        token_data = _json(response)
+        access_token = token_data['access_token']
+        expires_in = token_data.get('expires_in', 7200)  # Default 2 hours
+        
+        # Set expiration time (subtract 60 seconds buffer)
+        expires_at = datetime.now() + timedelta(seconds=expires_in - 60)
+        cls._store_cached_token(oauth_key, oauth_secret, access_token, expires_at)
+        return access_token, expires_at, expires_in
+    
+    @staticmethod
+    def _token_cache_key(oauth_key: str, oauth_secret: str) -> str:
+        """Cache key for a consumer: its key plus a digest of its secret, so a wrong secret never hits"""
+        return f"{oauth_key}:{hashlib.sha256(oauth_secret.encode('utf-8')).hexdigest()}"
+    
+    @classmethod
+    def _cached_token(cls, oauth_key: str, oauth_secret: str) -> Optional[Tuple[str, datetime]]:
+        """(token, expires_at) for this OAuth consumer from memory or disk, if it has TOKEN_MIN_LIFETIME left"""
+        cache_key = cls._token_cache_key(oauth_key, oauth_secret)
+        usable_until = datetime.now() + cls.TOKEN_MIN_LIFETIME
+        with cls._TOKEN_CACHE_LOCK:
+            cached = cls._TOKEN_CACHE.get(cache_key)
+            if cached is None or usable_until >= cached[1]:
+                try:
+                    with open(cls.TOKEN_CACHE_PATH, 'r', encoding='utf-8') as f:
+                        token, expires_at = json.load(f)[cache_key]
+                    cached = (token, datetime.fromisoformat(expires_at))
+                except (OSError, ValueError, KeyError, TypeError):
+                    return None
+                if usable_until >= cached[1]:
+                    return None
+                cls._TOKEN_CACHE[cache_key] = cached
+        return cached
+    
+    def _load_cached_token(self) -> bool:
+        """Adopt an unexpired token for this OAuth consumer from memory or disk"""
+        cached = self._cached_token(self.oauth_key, self.oauth_secret)
+        if cached is None:
+            return False
+        
+        self.access_token, self.token_expires_at = cached
+        self.session.headers.update({
+            'Authorization': f'Bearer {self.access_token}'
+        })
+        logger.info("Reusing cached OAuth token")
+        return True
+    
+    @classmethod
+    def _store_cached_token(cls, oauth_key: str, oauth_secret: str, access_token: str,
+                            expires_at: datetime):
+        """Remember a token in memory and in a user-only file on disk"""
+        cache_key = cls._token_cache_key(oauth_key, oauth_secret)
+        with cls._TOKEN_CACHE_LOCK:
+            cls._TOKEN_CACHE[cache_key] = (access_token, expires_at)
+            try:
+                try:
+                    with open(cls.TOKEN_CACHE_PATH, 'r', encoding='utf-8') as f:
+                        tokens = json.load(f)
+                except (OSError, ValueError):
+                    tokens = {}
+                tokens[cache_key] = [access_token, expires_at.isoformat()]
+                
+                os.makedirs(os.path.dirname(cls.TOKEN_CACHE_PATH), exist_ok=True)
+                tmp_path = f"{cls.TOKEN_CACHE_PATH}.tmp"
+                fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    json.dump(tokens, f)
+                os.replace(tmp_path, cls.TOKEN_CACHE_PATH)
+            except OSError as e:
+                logger.warning(f"Could not save OAuth token cache: {e}")
+    
     def _ensure_valid_token(self):
         """Ensure we have a valid access token, refresh if needed"""
         if not self.oauth_key or not self.oauth_secret:
             return  # Using static Bearer token, no refresh needed
         
-        if self.token_expires_at is None or datetime.now() >= self.token_expires_at:
-            self._refresh_oauth_token()
+        if not self._token_expired():
+            return  # Fast path: no lock while the token is valid
+        
+        # Double-checked: only the first worker to see the expiry refreshes,
+        # the rest find a fresh token once they get the lock
+        with self._token_lock:
+            if self._token_expired() and not self._load_cached_token():
+                self._refresh_oauth_token()
+    
+    def _token_expired(self) -> bool:
+        """Check whether the OAuth access token is missing or past its expiry"""
+        expires_at = self.token_expires_at
+        return expires_at is None or datetime.now() >= expires_at
+    
+    def get_repository_status(self) -> int:
+        """
+        HTTP status of a GET on the repository, used to validate credentials
+        
+        Goes through the client's pooled session, so the connection it opens is
+        reused by the PR fetches that follow.
+        """
+        self._ensure_valid_token()
+        response = self.session.get(
+            f"{self.BASE_URL}/repositories/{self.workspace}/{self.repository}",
+            timeout=self.REQUEST_TIMEOUT
+        )
+        return response.status_code
     
+    # The adapter retries only 502/504; connection errors, timeouts and
+    # 429/503 (honouring Retry-After) are retried here, other 4xx are final
     @retry(
-        retry=retry_if_exception_type((requests.exceptions.RequestException,)),
+        retry=retry_if_exception(_is_retryable),
         stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=1, min=2, max=60),
+        wait=_retry_wait,
         before_sleep=lambda retry_state: logger.warning(
             f"Retrying Bitbucket API call (attempt {retry_state.attempt_number}/5)..."
         ),
@@ -102,32 +411,94 @@ class BitbucketClient:
     )
     def _get(self, url: str, params: Optional[dict] = None) -> dict:
         """Make GET request to Bitbucket API"""
-        # Ensure we have a valid OAuth token
-        self._ensure_valid_token()
-        
         try:
-            response = self.session.get(url, params=params)
-            response.raise_for_status()
-            return response.json()
+            return self._conditional_get(url, params)
         except requests.exceptions.HTTPError as e:
             raise
         except requests.exceptions.RequestException as e:
             raise
     
-    def _get_paginated(self, url: str, params: Optional[dict] = None) -> List[dict]:
-        """Get all pages from paginated Bitbucket API endpoint"""
-        results = []
-        current_url = url
+    def _conditional_get(self, url: str, params: Optional[dict] = None) -> dict:
+        """
+        GET a JSON resource, revalidating any copy cached by an earlier run
+        
+        The stored ETag / Last-Modified validators are sent along; an unchanged
+        resource comes back as an empty 304 and is served from the cache.
+        """
+        # Ensure we have a valid OAuth token
+        self._ensure_valid_token()
+        
+        key = cached = None
+        if self._cache is not None:
+            key = f"{url}?{urlencode(params)}" if params else url
+            with self._cache_lock:
+                cached = self._cache.get(key)
+        headers = cached[0] if cached else None
+        
+        with self._request_slots:
+            response = self.session.get(url, params=params, headers=headers, timeout=self.REQUEST_TIMEOUT)
+        if response.status_code == 304 and cached:
+            return _json_loads(cached[1])
+        response.raise_for_status()
+        
+        if key:
+            validators = {}
+            if response.headers.get('ETag'):
+                validators['If-None-Match'] = response.headers['ETag']
+            if response.headers.get('Last-Modified'):
+                validators['If-Modified-Since'] = response.headers['Last-Modified']
+            if validators:
+                with self._cache_lock:
+                    self._cache[key] = (validators, response.content)
+        return _json(response)
+    
+    def _iter_paginated(self, url: str, params: Optional[dict] = None, parallel: bool = False) -> Iterator[dict]:
+        """
+        Yield items from every page of a paginated Bitbucket API endpoint
         
-        while current_url:
-            data = self._get(current_url, params)
+        Pages are yielded as they arrive, so callers never hold more than the
+        pages they keep themselves.
+        
+        Args:
+            url: Endpoint URL
+            params: Query parameters for the first request
+            parallel: Fetch the remaining pages concurrently when the first page
+                      reports 'size' and 'pagelen' (otherwise follow 'next' links)
+        """
+        data = self._get(url, params)
+        
+        while True:
             if data is None:
                 raise RuntimeError("Bitbucket API request failed - check credentials and permissions")
-            results.extend(data.get('values', []))
-            current_url = data.get('next')
-            params = None  # Params are included in 'next' URL
-        
-        return results
+            next_url = data.get('next')
+            
+            if parallel and next_url and data.get('size') and data.get('pagelen'):
+                yield from data.get('values', [])
+                yield from self._iter_remaining_pages(url, params, data['size'], data['pagelen'])
+                return
+            parallel = False  # Only the first page carries the totals we need
+            
+            # Cursor-only endpoints (e.g. commits) report no size, so the next
+            # page is requested while the caller consumes this one
+            next_page = self._page_executor.submit(self._get, next_url) if next_url else None
+            yield from data.get('values', [])
+            if next_page is None:
+                return
+            data = next_page.result()  # Params are included in 'next' URL
+    
+    def _iter_remaining_pages(self, url: str, params: Optional[dict], size: int, pagelen: int) -> Iterator[dict]:
+        """Fetch pages 2..N of a paginated endpoint concurrently, yielding items in page order"""
+        page_count = math.ceil(size / pagelen)
+        page_params = [dict(params or {}, page=page) for page in range(2, page_count + 1)]
+        
+        if not page_params:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(page_params))) as executor:
+            for data in executor.map(lambda p: self._get(url, p), page_params):
+                if data is None:
+                    raise RuntimeError("Bitbucket API request failed - check credentials and permissions")
+                yield from data.get('values', [])
     
     def get_pull_request_data(self, pr_number: int) -> Optional[dict]:
         """
@@ -142,9 +513,7 @@ class BitbucketClient:
         url = f"{self.BASE_URL}/repositories/{self.workspace}/{self.repository}/pullrequests/{pr_number}"
         
         try:
-            response = self.session.get(url)
-            response.raise_for_status()
-            return response.json()
+            return self._conditional_get(url)
             
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
@@ -184,30 +553,55 @@ class BitbucketClient:
         Returns:
             List of PullRequest objects
         """
+        return list(self.iter_pull_requests(state))
+    
+    def iter_pull_requests(self, state: Optional[str] = None) -> Iterator[PullRequest]:
+        """
+        Yield pull requests in API order as soon as each one is parsed
+        
+        At most PARSE_WINDOW PRs are fetched ahead of the consumer, so a slow
+        consumer holds back the Bitbucket fetch instead of buffering every PR.
+        
+        Args:
+            state: Filter by state (OPEN, MERGED, DECLINED, SUPERSEDED). None for all.
+        """
         url = f"{self.BASE_URL}/repositories/{self.workspace}/{self.repository}/pullrequests"
         
         #  fetch ALL states
-        # Bitbucket API supports multiple state parameters in single request
         if state is None:
-            # Use query params with multiple state values for single API call
+            # Single BBQL filter covering every state
             params = {
-                'state': ['OPEN', 'MERGED', 'DECLINED', 'SUPERSEDED']
+                'q': ' OR '.join(f'state="{pr_state}"' for pr_state in self.PR_STATES),
+                'pagelen': self.pagelen,
+                'fields': PR_LIST_FIELDS
             }
-            pr_data_list = self._get_paginated(url, params)
         else:
-            params = {'state': state}
-            pr_data_list = self._get_paginated(url, params)
-        
-        pull_requests = []
-        for pr_data in pr_data_list:
-            try:
-                pr = self._parse_pull_request(pr_data)
-                pull_requests.append(pr)
-            except Exception as e:
-                pr_id = pr_data.get('id', 'unknown')
-                logger.error(f"Failed to parse PR #{pr_id}: {e}")
-        
-        return pull_requests
+            params = {'state': state, 'pagelen': self.pagelen, 'fields': PR_LIST_FIELDS}
+        # Encode the query once; every later page URL comes back from the API
+        url = f"{url}?{urlencode(params)}"
+        
+        # Each PR needs several more API calls (comments, commits, tasks), so
+        # parse them concurrently, starting as soon as each page arrives.
+        # Results are yielded in submission order to keep the API's PR ordering.
+        pending = deque()
+        with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            for pr_data in self._iter_paginated(url, parallel=True):
+                pending.append((
+                    pr_data.get('id', 'unknown'),
+                    executor.submit(self._parse_pull_request, pr_data)
+                ))
+                if len(pending) >= self.PARSE_WINDOW:
+                    yield from self._parsed(*pending.popleft())
+            while pending:
+                yield from self._parsed(*pending.popleft())
+    
+    @staticmethod
+    def _parsed(pr_id, future) -> Iterator[PullRequest]:
+        """Yield a parse future's PR, or log the failure and yield nothing"""
+        try:
+            yield future.result()
+        except Exception as e:
+            logger.error(f"Failed to parse PR #{pr_id}: {e}")
     
     def _parse_pull_request(self, pr_data: dict, fetch_full_details: bool = True) -> PullRequest:
         """Parse Bitbucket PR data into PullRequest object"""
@@ -215,31 +609,29 @@ class BitbucketClient:
         
         # If we don't have reviewers/participants data (from paginated list), fetch full PR details
         if fetch_full_details and ('reviewers' not in pr_data or 'participants' not in pr_data):
-            logger.info(f"Fetching full PR details for PR #{pr_id} (reviewers/participants missing from summary)")
+            logger.info("Fetching full PR details for PR #%s (reviewers/participants missing from summary)", pr_id)
             full_pr_data = self.get_pull_request_data(pr_id)
             if full_pr_data:
                 pr_data = full_pr_data
         
         # Get author info (Issue #5: Prioritize username over display_name)
-        author_data = pr_data.get('author', {})
-        # Priority: nickname (username) > display_name > account_id
-        author = author_data.get('nickname') or author_data.get('display_name') or author_data.get('account_id', 'unknown')
-        author_email = author_data.get('account_id')  # Bitbucket account_id for reference
+        author, author_email = self._extract_user(pr_data.get('author') or _EMPTY)
         
         # Parse dates
-        created_date = parser.parse(pr_data['created_on'])
-        updated_date = parser.parse(pr_data['updated_on'])
-        closed_date = None
-        if pr_data.get('closed_on'):
-            closed_date = parser.parse(pr_data['closed_on'])
+        created_date = _parse_timestamp(pr_data['created_on'])
+        updated_date = _parse_timestamp(pr_data['updated_on'])
+        closed_on = pr_data.get('closed_on')
+        closed_date = _parse_timestamp(closed_on) if closed_on else None
         
         # Get branch info
-        source_branch = pr_data['source']['branch']['name']
-        dest_branch = pr_data['destination']['branch']['name']
+        source = pr_data['source']
+        destination = pr_data['destination']
+        source_branch = source['branch']['name']
+        dest_branch = destination['branch']['name']
         
         # Check if source is from a fork (different repository)
-        source_repo_data = pr_data.get('source', {}).get('repository', {})
-        dest_repo_data = pr_data.get('destination', {}).get('repository', {})
+        source_repo_data = source.get('repository') or _EMPTY
+        dest_repo_data = destination.get('repository') or _EMPTY
         
         is_fork = False
         fork_repo_owner = None
@@ -254,12 +646,14 @@ class BitbucketClient:
                 # Extract owner from full_name (format: "owner/repo")
                 if '/' in source_full_name:
                     fork_repo_owner, fork_repo_name = source_full_name.split('/', 1)
-                    logger.debug(f"PR #{pr_id} is from fork: {source_full_name}")
+                    logger.debug("PR #%s is from fork: %s", pr_id, source_full_name)
         
         # Get merge commit if merged
+        state = pr_data['state']
         merge_commit = None
-        if pr_data['state'] == 'MERGED' and pr_data.get('merge_commit'):
-            merge_commit = pr_data['merge_commit'].get('hash')
+        merge_commit_data = pr_data.get('merge_commit')
+        if state == 'MERGED' and merge_commit_data:
+            merge_commit = merge_commit_data.get('hash')
         
         # Create PR object
         pr = PullRequest(
@@ -270,7 +664,7 @@ class BitbucketClient:
             author_email=author_email,
             source_branch=source_branch,
             destination_branch=dest_branch,
-            state=pr_data['state'],
+            state=state,
             created_date=created_date,
             updated_date=updated_date,
             closed_date=closed_date,
@@ -283,55 +677,77 @@ class BitbucketClient:
         )
         
         # Get close source commit if PR is closed
-        if pr.is_closed() and pr_data.get('source', {}).get('commit', {}).get('hash'):
-            pr.close_source_commit = pr_data['source']['commit']['hash']
+        if pr.is_closed():
+            close_source_commit = (source.get('commit') or _EMPTY).get('hash')
+            if close_source_commit:
+                pr.close_source_commit = close_source_commit
         
-        # Fetch additional details
-        logger.debug(f"Fetching details for PR #{pr_id}: {pr.title}")
-        pr.comments = self._get_pr_comments(pr_id)
         pr.reviewers = self._get_pr_reviewers(pr_data)
-        pr.commits = self._get_pr_commits(pr_id)
-        pr.tasks = self._get_pr_tasks(pr_id)
+        self._fetch_details(pr)
         
         return pr
     
+    def _fetch_details(self, pr: PullRequest):
+        """Fetch a PR's comments, commits and tasks (independent requests, so issue them together)"""
+        logger.debug("Fetching details for PR #%s: %s", pr.id, pr.title)
+        comments_future = self._detail_executor.submit(self._get_pr_comments, pr.id)
+        commits_future = self._detail_executor.submit(self._get_pr_commits, pr.id)
+        tasks_future = self._detail_executor.submit(self._get_pr_tasks, pr.id)
+        pr.comments = comments_future.result()
+        pr.commits = commits_future.result()
+        pr.tasks = tasks_future.result()
+    
+    @staticmethod
+    def _extract_user(user_data: Mapping) -> tuple[str, Optional[str]]:
+        """
+        Resolve a Bitbucket user object to (username, account_id)
+        
+        Priority (Issue #5): nickname (username) > display_name > account_id
+        
+        The strings are interned: the same few users recur across every comment,
+        task and reviewer, and each decoded JSON string is otherwise a new copy.
+        """
+        account_id = user_data.get('account_id')
+        username = user_data.get('nickname') or user_data.get('display_name') or user_data.get('account_id', 'unknown')
+        return (sys.intern(username) if username else username,
+                sys.intern(account_id) if account_id else account_id)
+    
+    def _reviewer(self, username: str, email: Optional[str], approval_status: Optional[str]) -> PRReviewer:
+        """Get the shared (immutable) PRReviewer for this user and approval status"""
+        key = (username, email, approval_status)
+        reviewer = self._reviewer_cache.get(key)
+        if reviewer is None:
+            reviewer = self._reviewer_cache.setdefault(
+                key, PRReviewer(username=username, email=email, approval_status=approval_status)
+            )
+        return reviewer
+    
     def _get_pr_comments(self, pr_id: int) -> List[PRComment]:
         """Fetch comments for a pull request"""
         url = f"{self.BASE_URL}/repositories/{self.workspace}/{self.repository}/pullrequests/{pr_id}/comments"
         
         try:
-            comments_data = self._get_paginated(url)
             comments = []
+            comment_authors = {}  # Comment ID -> author, for parent lookups
+            replies = []  # Replies get their parent's author once every comment is known
             
-            # First pass: Build a mapping of comment IDs to authors for parent lookups
-            comment_authors = {}
-            for comment_data in comments_data:
+            # Single pass over the pages as they arrive
+            for comment_data in self._iter_paginated(url, {'fields': COMMENT_FIELDS, 'pagelen': self.pagelen}, parallel=True):
                 comment_id = comment_data['id']
-                author_data = comment_data.get('user', {})
-                author = author_data.get('nickname') or author_data.get('display_name') or author_data.get('account_id', 'unknown')
-                comment_authors[comment_id] = author
-            
-            # Second pass: Process all comments with correct parent author lookup
-            for comment_data in comments_data:
                 # Get author info (Issue #5: Prioritize username over display_name)
-                author_data = comment_data.get('user', {})
-                # Priority: nickname (username) > display_name > account_id
-                author = author_data.get('nickname') or author_data.get('display_name') or author_data.get('account_id', 'unknown')
-                author_email = author_data.get('account_id')
+                author, author_email = self._extract_user(comment_data.get('user') or _EMPTY)
+                comment_authors[comment_id] = author
                 
                 # Extract parent comment information (for replies)
                 parent_id = None
-                parent_author = None
-                if comment_data.get('parent'):
-                    parent_id = comment_data['parent'].get('id')
-                    # Look up parent author from our mapping (more reliable than nested API data)
-                    parent_author = comment_authors.get(parent_id, 'Unknown User')
-                    logger.debug(f"Comment {comment_data['id']} is a reply to comment {parent_id} by {parent_author}")
+                parent_data = comment_data.get('parent')
+                if parent_data:
+                    parent_id = parent_data.get('id')
                 
                 # Extract inline comment data (file, line numbers)
                 inline = None
-                if comment_data.get('inline'):
-                    inline_data = comment_data['inline']
+                inline_data = comment_data.get('inline')
+                if inline_data:
                     inline = {
                         'path': inline_data.get('path', ''),
                         'from': inline_data.get('from'),
@@ -340,26 +756,34 @@ class BitbucketClient:
                 
                 # Extract attachments from comment (separate from inline markdown images)
                 attachments = []
-                if comment_data.get('links') and comment_data['links'].get('attachments'):
+                links = comment_data.get('links')
+                if self.workspace not in self._ATTACHMENTS_UNSUPPORTED and links and (links.get('attachments') or _EMPTY).get('href'):
                     # Fetch attachments for this comment
-                    attachments = self._get_comment_attachments(pr_id, comment_data['id'])
+                    attachments = self._get_comment_attachments(pr_id, comment_id)
                 
+                updated_on = comment_data.get('updated_on')
                 comment = PRComment(
-                    id=comment_data['id'],
+                    id=comment_id,
                     author=author,
                     author_email=author_email,
                     content=comment_data['content']['raw'],
-                    created_date=parser.parse(comment_data['created_on']),
-                    updated_date=parser.parse(comment_data['updated_on']) if comment_data.get('updated_on') else None,
+                    created_date=_parse_timestamp(comment_data['created_on']),
+                    updated_date=_parse_timestamp(updated_on) if updated_on else None,
                     inline=inline,
                     parent_id=parent_id,
-                    parent_author=parent_author,
                     attachments=attachments
                 )
                 comments.append(comment)
+                if parent_data:
+                    replies.append(comment)
+            
+            # Look up parent authors from our mapping (more reliable than nested API data)
+            for comment in replies:
+                comment.parent_author = comment_authors.get(comment.parent_id, 'Unknown User')
+                logger.debug("Comment %s is a reply to comment %s by %s", comment.id, comment.parent_id, comment.parent_author)
             
             # Sort comments by date
-            comments.sort(key=lambda x: x.created_date)
+            comments.sort(key=attrgetter('created_date'))
             
             logger.debug(f"Fetched {len(comments)} comments")
             return comments
@@ -375,44 +799,39 @@ class BitbucketClient:
         reviewer_usernames_seen = set()  # Track to avoid duplicates
         
         # Log what we're processing
-        logger.info(f"Extracting reviewers from PR data. Top-level 'reviewers': {len(pr_data.get('reviewers', []))}, 'participants': {len(pr_data.get('participants', []))}")
+        logger.info(
+            "Extracting reviewers from PR data. Top-level 'reviewers': %d, 'participants': %d",
+            len(pr_data.get('reviewers', [])), len(pr_data.get('participants', []))
+        )
+        
+        # Index participants by username once (first entry wins) for approval lookups
+        participants_by_username = {}
+        for participant in pr_data.get('participants', []):
+            participants_by_username.setdefault(self._extract_user(participant.get('user') or _EMPTY)[0], participant)
         
         # First, extract from the top-level 'reviewers' array (explicitly assigned reviewers)
         for reviewer_data in pr_data.get('reviewers', []):
-            user_data = reviewer_data if isinstance(reviewer_data, dict) and 'nickname' in reviewer_data else reviewer_data
-            # Priority: nickname (username) > display_name > account_id (Issue #5)
-            username = user_data.get('nickname') or user_data.get('display_name') or user_data.get('account_id', 'unknown')
-            email = user_data.get('account_id')
+            username, email = self._extract_user(reviewer_data)
             
             if username not in reviewer_usernames_seen:
                 reviewer_usernames_seen.add(username)
                 # Check participants for approval status
                 approval_status = None
-                for participant in pr_data.get('participants', []):
-                    part_user = participant.get('user', {})
-                    part_username = part_user.get('nickname') or part_user.get('display_name') or part_user.get('account_id', 'unknown')
-                    if part_username == username:
-                        if participant.get('approved'):
-                            approval_status = 'approved'
-                        elif participant.get('state') == 'changes_requested':
-                            approval_status = 'changes_requested'
-                        break
+                participant = participants_by_username.get(username)
+                if participant:
+                    if participant.get('approved'):
+                        approval_status = 'approved'
+                    elif participant.get('state') == 'changes_requested':
+                        approval_status = 'changes_requested'
                 
-                reviewer = PRReviewer(
-                    username=username,
-                    email=email,
-                    approval_status=approval_status
-                )
+                reviewer = self._reviewer(username, email, approval_status)
                 reviewers.append(reviewer)
-                logger.info(f"Added reviewer from 'reviewers' array: {username} (approval: {approval_status})")
+                logger.info("Added reviewer from 'reviewers' array: %s (approval: %s)", username, approval_status)
         
         # Then, extract from 'participants' array (people with REVIEWER role not already added)
         for participant in pr_data.get('participants', []):
             if participant.get('role') == 'REVIEWER':
-                user_data = participant.get('user', {})
-                # Priority: nickname (username) > display_name > account_id (Issue #5)
-                username = user_data.get('nickname') or user_data.get('display_name') or user_data.get('account_id', 'unknown')
-                email = user_data.get('account_id')
+                username, email = self._extract_user(participant.get('user') or _EMPTY)
                 
                 if username not in reviewer_usernames_seen:
                     reviewer_usernames_seen.add(username)
@@ -423,15 +842,11 @@ class BitbucketClient:
                     elif participant.get('state') == 'changes_requested':
                         approval_status = 'changes_requested'
                     
-                    reviewer = PRReviewer(
-                        username=username,
-                        email=email,
-                        approval_status=approval_status
-                    )
+                    reviewer = self._reviewer(username, email, approval_status)
                     reviewers.append(reviewer)
-                    logger.info(f"Added reviewer from 'participants' array: {username} (approval: {approval_status})")
+                    logger.info("Added reviewer from 'participants' array: %s (approval: %s)", username, approval_status)
         
-        logger.info(f"Total reviewers extracted: {len(reviewers)}")
+        logger.info("Total reviewers extracted: %d", len(reviewers))
         return reviewers
     
     def _get_pr_commits(self, pr_id: int) -> List[str]:
@@ -439,8 +854,7 @@ class BitbucketClient:
         url = f"{self.BASE_URL}/repositories/{self.workspace}/{self.repository}/pullrequests/{pr_id}/commits"
         
         try:
-            commits_data = self._get_paginated(url)
-            commit_shas = [commit['hash'] for commit in commits_data]
+            commit_shas = [commit['hash'] for commit in self._iter_paginated(url, {'fields': COMMIT_FIELDS, 'pagelen': self.pagelen}, parallel=True)]
             logger.debug(f"Fetched {len(commit_shas)} commits")
             return commit_shas
         
@@ -459,22 +873,27 @@ class BitbucketClient:
         Returns:
             List of attachment dictionaries with 'name' and 'url'
         """
+        if self.workspace in self._ATTACHMENTS_UNSUPPORTED:
+            return []
+        
         url = f"{self.BASE_URL}/repositories/{self.workspace}/{self.repository}/pullrequests/{pr_id}/comments/{comment_id}/attachments"
         
         try:
-            response = self.session.get(url)
+            response = self.session.get(url, timeout=self.REQUEST_TIMEOUT)
             
             # Check for payment required error (free tier limitation)
             if response.status_code == 402:
-                logger.warning(
-                    f"Cannot access attachments for comment {comment_id}: "
-                    "Bitbucket workspace requires paid plan (Standard/Premium) to access file attachments via API. "
-                    "Inline images in markdown will still be migrated."
-                )
+                if self.workspace not in self._ATTACHMENTS_UNSUPPORTED:
+                    self._ATTACHMENTS_UNSUPPORTED.add(self.workspace)
+                    logger.warning(
+                        f"Cannot access attachments for comment {comment_id}: "
+                        "Bitbucket workspace requires paid plan (Standard/Premium) to access file attachments via API. "
+                        "Inline images in markdown will still be migrated."
+                    )
                 return []
             
             response.raise_for_status()
-            data = response.json()
+            data = _json(response)
             
             attachments_data = data.get('values', [])
             attachments = []
@@ -483,14 +902,14 @@ class BitbucketClient:
                 # Get attachment name and download URL
                 name = attachment_data.get('name', 'attachment')
                 # Use the 'href' from 'links.self' for download URL
-                download_url = attachment_data.get('links', {}).get('self', {}).get('href', '')
+                download_url = ((attachment_data.get('links') or _EMPTY).get('self') or _EMPTY).get('href', '')
                 
                 if download_url:
                     attachments.append({
                         'name': name,
                         'url': download_url
                     })
-                    logger.info(f"Found attachment: {name}")
+                    logger.info("Found attachment: %s", name)
             
             return attachments
         
@@ -520,20 +939,17 @@ class BitbucketClient:
         url = f"{self.BASE_URL}/repositories/{self.workspace}/{self.repository}/pullrequests/{pr_id}/tasks"
         
         try:
-            tasks_data = self._get_paginated(url)
             tasks = []
             
-            for task_data in tasks_data:
+            for task_data in self._iter_paginated(url, {'fields': TASK_FIELDS, 'pagelen': self.pagelen}, parallel=True):
                 # Get creator info
-                creator_data = task_data.get('creator', {})
-                creator = creator_data.get('nickname') or creator_data.get('display_name') or creator_data.get('account_id', 'unknown')
-                creator_email = creator_data.get('account_id')
+                creator, creator_email = self._extract_user(task_data.get('creator') or _EMPTY)
                 
                 # Parse dates
-                created_date = parser.parse(task_data['created_on'])
+                created_date = _parse_timestamp(task_data['created_on'])
                 updated_date = None
                 if task_data.get('updated_on'):
-                    updated_date = parser.parse(task_data['updated_on'])
+                    updated_date = _parse_timestamp(task_data['updated_on'])
                 
                 # Get comment ID if task is attached to a comment
                 comment_id = None
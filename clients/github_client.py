@@ -1,10 +1,20 @@
 """
 GitHub API client for migrating pull requests
 """
+import io
+import json
 import logging
+import re
+import threading
+import time
+import requests
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Tuple
-from github import Github, GithubException
+from itertools import islice
+from urllib.parse import quote
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from github import Auth, Github, GithubException
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 from models import PullRequest, PRComment, PRReviewer, PRTask
 from utils import UserMapper, MarkdownConverter, ImageMigrator
@@ -12,14 +22,82 @@ from utils import UserMapper, MarkdownConverter, ImageMigrator
 
 logger = logging.getLogger(__name__)
 
+# IST is UTC + 5:30
+_IST = timezone(timedelta(hours=5, minutes=30))
+
+# Bitbucket UUID mention, e.g. @{712020:634d5063-6091-4f3c-8b08-64ccd298144d}
+_UUID_MENTION_RE = re.compile(r'@\{([0-9]+:[a-f0-9-]+)\}')
+
+
+class _MentionReplacer:
+    """Replacement callable for _UUID_MENTION_RE that resolves account IDs to usernames"""
+    
+    __slots__ = ('account_id_to_username', 'user_mapper', 'replacements')
+    
+    def __init__(self, account_id_to_username: dict, user_mapper: UserMapper):
+        self.account_id_to_username = account_id_to_username
+        self.user_mapper = user_mapper
+        # account_id -> replacement text, resolved on first mention
+        self.replacements: Dict[str, str] = {}
+    
+    def __call__(self, match) -> str:
+        account_id = match.group(1)
+        replacement = self.replacements.get(account_id)
+        if replacement is None:
+            replacement = self.replacements[account_id] = self._resolve(account_id)
+        return replacement
+    
+    def _resolve(self, account_id: str) -> str:
+        username = self.account_id_to_username.get(account_id)
+        if username:
+            # Try to get GitHub username mapping
+            github_user = self.user_mapper.get_github_user(username)
+            if github_user:
+                return f"@{github_user}"
+            return f"@{username}"
+        return "*(user mention)*"  # Fallback if not found
+
 
 class GitHubClient:
     """Client for interacting with GitHub API to create pull requests"""
     
+    # Attempts for a branch lookup that fails with an API error
+    BRANCH_CHECK_ATTEMPTS = 5
+    
+    # Commit SHAs looked up per GraphQL query; the pre-flight query checks up
+    # to this many inline, larger PRs go through verify_commits_exist
+    GRAPHQL_MAX_COMMITS = 100
+    
+    # Keep-alive connections held by PyGithub's session, and list page size
+    # (the API maximum) so collaborator/PR listings take fewer round trips
+    POOL_SIZE = 20
+    PER_PAGE = 100
+    
+    # Pause before a call once fewer than RATE_LIMIT_FLOOR requests (or GraphQL
+    # points) are left in its budget, for at most MAX_RATE_LIMIT_WAIT seconds
+    # (secondary limits and Retry-After are handled by PyGithub's GithubRetry)
+    RATE_LIMIT_FLOOR = 50
+    MAX_RATE_LIMIT_WAIT = 900
+    # Seconds between re-reads of the core budget from /rate_limit
+    RATE_LIMIT_REFRESH = 60
+    
+    # Seconds before the cached collaborator list is fetched again
+    COLLABORATOR_TTL = 300
+    
+    # Worker threads for independent per-PR work (comment bodies, reviewer checks)
+    MAX_WORKERS = 5
+    
+    # Open PR numbers quoted in the "PR already exists" error
+    EXISTING_PR_SAMPLE = 3
+    
+    # Comments posted per GraphQL request; the addComment mutations in one
+    # request run one after another, so comment order is kept
+    COMMENT_BATCH_SIZE = 10
+    
     def __init__(self, token: str, owner: str, repository: str,
                  bitbucket_workspace: Optional[str] = None, bitbucket_repo: Optional[str] = None, 
                  bitbucket_token: Optional[str] = None, skip_commit_verification: bool = False,
-                 skip_prs_with_missing_branches: bool = False):
+                 skip_prs_with_missing_branches: bool = False, user_mapper: Optional[UserMapper] = None):
         """
         Initialize GitHub client
         
@@ -32,15 +110,38 @@ class GitHubClient:
             bitbucket_token: Bitbucket token (for image migration)
             skip_commit_verification: Skip commit SHA verification (useful for rebased repos)
             skip_prs_with_missing_branches: Skip PRs with missing source branches
+            user_mapper: Shared UserMapper (a new one is loaded if not given)
         """
-        self.github = Github(token)
+        self.github = Github(auth=Auth.Token(token), pool_size=self.POOL_SIZE, per_page=self.PER_PAGE)
         self.owner = owner
         self.repository = repository
-        self.user_mapper = UserMapper()
+        self.user_mapper = user_mapper or UserMapper()
         self.markdown_converter = MarkdownConverter()
         self.repo = self.github.get_repo(f"{owner}/{repository}")
         self.skip_commit_verification = skip_commit_verification
         self.skip_prs_with_missing_branches = skip_prs_with_missing_branches
+        self._executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+        
+        # Branch name -> (exists, ETag) from the last branch lookup
+        self._branch_cache: Dict[str, Tuple[bool, Optional[str]]] = {}
+        
+        # Branches already seen on GitHub this run; most PRs share a destination
+        self._known_branches: Set[str] = set()
+        
+        # Commit SHAs already confirmed to exist on GitHub
+        self._known_commits: Set[str] = set()
+        
+        # Lower-cased collaborator logins, fetched on first reviewer check
+        self._collaborator_logins: Optional[FrozenSet[str]] = None
+        self._collaborators_expire_at = 0.0
+        # page number -> (ETag, logins on that page) for conditional refreshes
+        self._collaborator_pages: Dict[int, Tuple[Optional[str], FrozenSet[str]]] = {}
+        self._collaborator_lock = threading.Lock()
+        
+        # X-RateLimit-Resource ("core", "graphql") -> (remaining, limit, reset epoch)
+        self._rate_budgets: Dict[str, Tuple[int, int, int]] = {}
+        self._core_budget_checked = 0.0
+        self._rate_lock = threading.Lock()
         
         # Store Bitbucket info for URL generation in closed issues
         self.bitbucket_workspace = bitbucket_workspace or "unknown"
@@ -59,14 +160,77 @@ class GitHubClient:
             )
             logger.info("Image migration enabled")
     
-    @retry(
-        retry=retry_if_exception_type((GithubException,)),
-        stop=stop_after_attempt(5),
-        wait=wait_exponential(multiplier=1, min=2, max=60),
-        before_sleep=lambda retry_state: logger.warning(
-            f"Retrying GitHub API call (attempt {retry_state.attempt_number}/5)..."
-        )
-    )
+    def _rate_guard(self, graphql: bool = False):
+        """
+        Wait for a rate limit to reset when its remaining budget is nearly spent
+        
+        GitHub budgets REST ("core") and GraphQL separately, so each is tracked
+        under the X-RateLimit-Resource its responses report. The GraphQL budget
+        is updated by every GraphQL response; most REST calls go through PyGithub
+        objects that hide their headers, so the core budget is re-read from
+        /rate_limit (which costs nothing) at most every RATE_LIMIT_REFRESH seconds.
+        
+        Args:
+            graphql: Guard the GraphQL budget instead of the core one
+        """
+        resource = 'graphql' if graphql else 'core'
+        if not graphql and time.time() - self._core_budget_checked >= self.RATE_LIMIT_REFRESH:
+            self._refresh_core_budget()
+        
+        with self._rate_lock:
+            budget = self._rate_budgets.get(resource)
+        if budget is None or budget[0] >= self.RATE_LIMIT_FLOOR:
+            return
+        
+        remaining, limit, reset = budget
+        wait_time = min(reset - time.time() + 1, self.MAX_RATE_LIMIT_WAIT)
+        if wait_time > 0:
+            logger.warning(f"GitHub {resource} rate limit nearly exhausted ({remaining}/{limit} left), "
+                           f"waiting {wait_time:.0f}s for reset...")
+            time.sleep(wait_time)
+        # The recorded budget predates the reset; read it afresh next time
+        with self._rate_lock:
+            self._rate_budgets.pop(resource, None)
+        if not graphql:
+            self._core_budget_checked = 0.0
+    
+    def _refresh_core_budget(self):
+        """Re-read the core budget from /rate_limit, which does not count against it"""
+        self._core_budget_checked = time.time()
+        try:
+            _, data = self.github.requester.requestJsonAndCheck("GET", "/rate_limit")
+        except GithubException as e:
+            logger.debug("Could not read the GitHub rate limit: %s", e)
+            return
+        
+        core = (data.get('resources') or {}).get('core') or {}
+        if {'remaining', 'limit', 'reset'} <= core.keys():
+            with self._rate_lock:
+                self._rate_budgets['core'] = (core['remaining'], core['limit'], core['reset'])
+    
+    def _note_rate_limit(self, headers: Optional[Dict[str, str]]):
+        """Record the budget a response reports, under its X-RateLimit-Resource"""
+        resource = (headers or {}).get('x-ratelimit-resource')
+        if not resource:
+            return
+        try:
+            budget = tuple(int(float(headers[f'x-ratelimit-{field}'])) for field in ('remaining', 'limit', 'reset'))
+        except (KeyError, TypeError, ValueError):
+            return
+        with self._rate_lock:
+            self._rate_budgets[resource] = budget
+    
+    def _graphql(self, query: str, variables: dict) -> dict:
+        """Run a GraphQL request under the GraphQL budget's guard, recording what it reports"""
+        self._rate_guard(graphql=True)
+        try:
+            headers, data = self.github.requester.graphql_query(query, variables)
+        except GithubException as e:
+            self._note_rate_limit(e.headers)
+            raise
+        self._note_rate_limit(headers)
+        return data
+    
     def verify_branch_exists(self, branch_name: str) -> bool:
         """
         Verify if a branch exists in the GitHub repository
@@ -77,13 +241,40 @@ class GitHubClient:
         Returns:
             True if branch exists, False otherwise
         """
-        try:
-            self.repo.get_branch(branch_name)
+        if branch_name in self._known_branches:
             return True
-        except GithubException as e:
-            if e.status == 404:
-                return False
-            raise
+        
+        # Plain retry loop: nearly every call succeeds first time, so the happy
+        # path is a single call (waits of 2, 4, 8, 16s between 5 attempts)
+        for attempt in range(1, self.BRANCH_CHECK_ATTEMPTS + 1):
+            try:
+                return self._lookup_branch(branch_name)
+            except GithubException:
+                if attempt == self.BRANCH_CHECK_ATTEMPTS:
+                    raise
+                logger.warning(f"Retrying GitHub API call (attempt {attempt}/{self.BRANCH_CHECK_ATTEMPTS})...")
+                time.sleep(min(2 ** attempt, 60))
+    
+    def _lookup_branch(self, branch_name: str) -> bool:
+        """Single branch lookup; raises GithubException for anything but 200/304/404"""
+        # Conditional GET against the last ETag: most PRs share a destination
+        # branch, and a 304 is served without touching the rate limit
+        cached = self._branch_cache.get(branch_name)
+        headers = {'If-None-Match': cached[1]} if cached and cached[1] else None
+        status, response_headers, output = self.github.requester.requestJson(
+            "GET", f"{self.repo.url}/branches/{quote(branch_name)}", headers=headers
+        )
+        self._note_rate_limit(response_headers)
+        
+        if status == 304 and cached:
+            return cached[0]
+        if status == 200:
+            self._branch_cache[branch_name] = (True, response_headers.get('etag'))
+            self._known_branches.add(branch_name)
+            return True
+        if status == 404:
+            return False
+        raise GithubException(status, output, response_headers)
     
     def verify_commits_exist(self, commit_shas: List[str]) -> Tuple[bool, List[str]]:
         """
@@ -96,36 +287,197 @@ class GitHubClient:
             Tuple of (all_exist: bool, missing_shas: List[str])
         """
         missing_shas = []
+        # Commits seen on GitHub earlier in the run cannot have disappeared
+        unknown_shas = [sha for sha in commit_shas if sha not in self._known_commits]
         
-        for sha in commit_shas:
-            max_attempts = 3
-            for attempt in range(max_attempts):
-                try:
-                    self.repo.get_commit(sha)
-                    break  # Success, move to next SHA
-                except GithubException as e:
-                    if e.status == 404:
-                        missing_shas.append(sha)
-                        logger.warning(f"Commit {sha} not found in GitHub repository")
-                        break  # 404 is definitive, no retry needed
-                    elif attempt < max_attempts - 1:
-                        # Retry on other errors (rate limits, timeouts, etc.)
-                        wait_time = 2 ** attempt  # Exponential backoff: 1, 2, 4 seconds
-                        logger.warning(f"Retrying commit verification for {sha} (attempt {attempt + 1}/{max_attempts})...")
-                        import time
-                        time.sleep(wait_time)
-                    else:
-                        # Final attempt failed, treat as missing
-                        logger.error(f"Failed to verify commit {sha} after {max_attempts} attempts: {e}")
-                        missing_shas.append(sha)
-                except Exception as e:
-                    # Handle any other unexpected errors
-                    logger.error(f"Unexpected error verifying commit {sha}: {e}")
-                    missing_shas.append(sha)
-                    break
+        # One GraphQL request per GRAPHQL_MAX_COMMITS SHAs instead of a GET per SHA
+        for start in range(0, len(unknown_shas), self.GRAPHQL_MAX_COMMITS):
+            chunk = unknown_shas[start:start + self.GRAPHQL_MAX_COMMITS]
+            try:
+                missing_shas.extend(self._find_missing_commits(chunk))
+            except Exception as e:
+                logger.warning(f"GraphQL commit lookup failed, checking {len(chunk)} commit(s) over REST: {e}")
+                missing_shas.extend(self._find_missing_commits_rest(chunk))
         
         return len(missing_shas) == 0, missing_shas
     
+    @retry(
+        retry=retry_if_exception_type((GithubException,)),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=1, max=4),
+        reraise=True,
+        before_sleep=lambda retry_state: logger.warning(
+            f"Retrying commit verification (attempt {retry_state.attempt_number}/3)..."
+        )
+    )
+    def _find_missing_commits(self, commit_shas: List[str]) -> List[str]:
+        """
+        Look up a batch of commit SHAs with one aliased GraphQL query
+        
+        Args:
+            commit_shas: Commit SHAs to look up (at most GRAPHQL_MAX_COMMITS)
+            
+        Returns:
+            SHAs that do not exist in the GitHub repository
+        """
+        declarations = ["$owner: String!", "$name: String!"]
+        variables = {'owner': self.owner, 'name': self.repository}
+        commit_fields = self._commit_query_fields(commit_shas, declarations, variables)
+        query = (
+            f"query({', '.join(declarations)}) {{ "
+            f"repository(owner: $owner, name: $name) {{ {' '.join(commit_fields)} }} }}"
+        )
+        
+        data = self._graphql(query, variables)
+        return self._missing_commits(commit_shas, data['data']['repository'])
+    
+    def _find_missing_commits_rest(self, commit_shas: List[str]) -> List[str]:
+        """
+        Look up commit SHAs one REST request at a time (fallback when GraphQL fails)
+        
+        Args:
+            commit_shas: Commit SHAs to look up
+            
+        Returns:
+            SHAs that do not exist or could not be verified
+        """
+        missing_shas = []
+        for sha in commit_shas:
+            try:
+                self.repo.get_commit(sha)
+                self._known_commits.add(sha)
+            except GithubException as e:
+                missing_shas.append(sha)
+                if e.status == 404:
+                    logger.warning(f"Commit {sha} not found in GitHub repository")
+                else:
+                    logger.error(f"Failed to verify commit {sha}: {e}")
+            except Exception as e:
+                logger.error(f"Unexpected error verifying commit {sha}: {e}")
+                missing_shas.append(sha)
+        return missing_shas
+    
+    @staticmethod
+    def _commit_query_fields(commit_shas: List[str], declarations: List[str], variables: dict) -> List[str]:
+        """
+        Build aliased `object` lookups (c0, c1, ...) for a GraphQL repository query
+        
+        Args:
+            commit_shas: Commit SHAs to look up
+            declarations: Query variable declarations, extended in place
+            variables: Query variables, extended in place
+            
+        Returns:
+            Field selections to place inside `repository { ... }`
+        """
+        commit_fields = []
+        for i, sha in enumerate(commit_shas):
+            declarations.append(f"$c{i}: String!")
+            variables[f"c{i}"] = sha
+            commit_fields.append(f"c{i}: object(expression: $c{i}) {{ oid }}")
+        return commit_fields
+    
+    def _missing_commits(self, commit_shas: List[str], repo_data: dict) -> List[str]:
+        """Return the SHAs whose aliased lookup came back null and remember the rest"""
+        missing_shas = []
+        for i, sha in enumerate(commit_shas):
+            if repo_data.get(f"c{i}") is None:
+                missing_shas.append(sha)
+                logger.warning(f"Commit {sha} not found in GitHub repository")
+            else:
+                self._known_commits.add(sha)
+        return missing_shas
+    
+    def _preflight_checks(self, pr: PullRequest) -> Optional[dict]:
+        """
+        Run the branch, commit and existing-PR checks for a PR in a single GraphQL query
+        
+        Args:
+            pr: PullRequest object about to be migrated
+            
+        Returns:
+            Dict with 'source_exists', 'destination_exists', 'missing_commits'
+            (None when commits were not checked) and 'existing_prs' (up to
+            EXISTING_PR_SAMPLE open PR numbers), or None if the query failed and REST
+            should be used
+        """
+        commits = []
+        if pr.commits and not self.skip_commit_verification:
+            commits = [sha for sha in pr.commits if sha not in self._known_commits]
+        check_commits = bool(pr.commits) and not self.skip_commit_verification and len(commits) <= self.GRAPHQL_MAX_COMMITS
+        if not check_commits:
+            commits = []
+        
+        declarations = ["$owner: String!", "$name: String!", "$src: String!", "$dst: String!", "$head: String!", "$base: String!"]
+        variables = {
+            'owner': self.owner,
+            'name': self.repository,
+            'src': f"refs/heads/{pr.source_branch}",
+            'dst': f"refs/heads/{pr.destination_branch}",
+            'head': pr.source_branch,
+            'base': pr.destination_branch,
+        }
+        commit_fields = self._commit_query_fields(commits, declarations, variables)
+        
+        query = (
+            f"query({', '.join(declarations)}) {{ "
+            "repository(owner: $owner, name: $name) { "
+            "src: ref(qualifiedName: $src) { name } "
+            "dst: ref(qualifiedName: $dst) { name } "
+            "existing: pullRequests(headRefName: $head, baseRefName: $base, states: OPEN, first: 100) "
+            "{ nodes { number headRepositoryOwner { login } } } "
+            f"{' '.join(commit_fields)} }} }}"
+        )
+        
+        try:
+            data = self._graphql(query, variables)
+            repo_data = data['data']['repository']
+            if repo_data is None:
+                raise KeyError('repository')
+        except (GithubException, KeyError, TypeError) as e:
+            logger.warning(f"GraphQL pre-flight check failed for PR #{pr.id}, falling back to REST: {e}")
+            return None
+        
+        missing_commits = self._missing_commits(commits, repo_data) if check_commits else None
+        
+        # Same-repository heads only, as in the REST head="owner:branch" filter;
+        # the first few are enough for the error message
+        owner = self.owner.lower()
+        existing_prs = list(islice(
+            (node['number'] for node in repo_data['existing']['nodes']
+             if (node.get('headRepositoryOwner') or {}).get('login', '').lower() == owner),
+            self.EXISTING_PR_SAMPLE
+        ))
+        
+        for ref in (repo_data['src'], repo_data['dst']):
+            if ref is not None:
+                self._known_branches.add(ref['name'])
+        
+        return {
+            'source_exists': repo_data['src'] is not None,
+            'destination_exists': repo_data['dst'] is not None,
+            'missing_commits': missing_commits,
+            'existing_prs': existing_prs,
+        }
+    
+    def _existing_pr_numbers(self, pr: PullRequest) -> List[int]:
+        """Open GitHub PRs with the same head and base (REST fallback for the pre-flight query)"""
+        # A single page sized to what the error message quotes, rather than
+        # get_pulls() paging in full PR objects at the client-wide page size
+        status, response_headers, output = self.github.requester.requestJson(
+            "GET", f"{self.repo.url}/pulls",
+            parameters={
+                'state': 'open',
+                'head': f"{self.owner}:{pr.source_branch}",
+                'base': pr.destination_branch,
+                'per_page': self.EXISTING_PR_SAMPLE,
+            }
+        )
+        self._note_rate_limit(response_headers)
+        if status != 200:
+            raise GithubException(status, output, response_headers)
+        return [existing['number'] for existing in json.loads(output)]
+    
     def _utc_to_ist(self, utc_datetime: datetime) -> str:
         """
         Convert UTC datetime to IST (India Standard Time) format
@@ -136,15 +488,32 @@ class GitHubClient:
         Returns:
             Formatted string in IST
         """
-        # IST is UTC + 5:30
-        ist_offset = timedelta(hours=5, minutes=30)
-        
         # Ensure the datetime is timezone-aware
         if utc_datetime.tzinfo is None:
             utc_datetime = utc_datetime.replace(tzinfo=timezone.utc)
         
-        ist_datetime = utc_datetime + ist_offset
-        return ist_datetime.strftime('%Y-%m-%d %H:%M:%S IST')
+        # Same "YYYY-MM-DD HH:MM:SS" layout as strftime, without the locale-aware path
+        return utc_datetime.astimezone(_IST).replace(tzinfo=None).isoformat(sep=' ', timespec='seconds') + ' IST'
+    
+    @staticmethod
+    def should_skip(pr: PullRequest) -> Optional[str]:
+        """
+        Check, without any API call, whether a PR is never migrated
+        
+        Args:
+            pr: PullRequest object
+            
+        Returns:
+            Reason the PR is skipped, or None if it should be migrated
+        """
+        if pr.is_fork:
+            return (
+                f"Fork PR from {pr.fork_repo_owner}/{pr.fork_repo_name} "
+                f"(branch: {pr.source_branch}). Fork PRs are not migrated."
+            )
+        if pr.source_branch == pr.destination_branch:
+            return f"Source and destination are the same branch ('{pr.source_branch}')"
+        return None
     
     def migrate_pull_request(self, pr: PullRequest) -> tuple[bool, str]:
         """
@@ -159,17 +528,27 @@ class GitHubClient:
         head = pr.source_branch  # Initialize head at the start
         
         try:
-            # Skip forked PRs
-            if pr.is_fork:
-                error_msg = (
-                    f"Fork PR from {pr.fork_repo_owner}/{pr.fork_repo_name} "
-                    f"(branch: {pr.source_branch}). Fork PRs are not migrated."
-                )
+            # Skip forked and same-branch PRs (callers normally filter these out with should_skip)
+            error_msg = self.should_skip(pr)
+            if error_msg:
                 logger.warning(f"Skipping PR #{pr.id}: {error_msg}")
                 return False, error_msg
             
+            self._rate_guard()
+            
+            # Convert the description while the pre-flight checks are in flight;
+            # PRs without one skip the executor round trip entirely
+            body_future = (self._executor.submit(self._build_pr_body, pr)
+                           if pr.description else None)
+            
+            # One GraphQL round trip covers the branch, commit and existing-PR
+            # checks; None means it failed and the REST checks below are used
+            preflight = self._preflight_checks(pr)
+            
             # Verify branches exist
-            if not self.verify_branch_exists(pr.source_branch):
+            source_exists = (preflight['source_exists'] if preflight
+                             else self.verify_branch_exists(pr.source_branch))
+            if not source_exists:
                 error_msg = f"Source branch '{pr.source_branch}' does not exist in GitHub"
                 if self.skip_prs_with_missing_branches:
                     logger.warning(f"Skipping PR #{pr.id}: {error_msg}")
@@ -177,15 +556,19 @@ class GitHubClient:
                 logger.error(error_msg)
                 return False, error_msg
             
-            if not self.verify_branch_exists(pr.destination_branch):
+            destination_exists = (preflight['destination_exists'] if preflight
+                                  else self.verify_branch_exists(pr.destination_branch))
+            if not destination_exists:
                 error_msg = f"Destination branch '{pr.destination_branch}' does not exist in GitHub"
                 logger.error(error_msg)
                 return False, error_msg
             
             # Verify commits exist on GitHub (Issue A: Commit validation)
             if pr.commits and not self.skip_commit_verification:
-                all_commits_exist, missing_commits = self.verify_commits_exist(pr.commits)
-                if not all_commits_exist:
+                missing_commits = preflight['missing_commits'] if preflight else None
+                if missing_commits is None:
+                    _, missing_commits = self.verify_commits_exist(pr.commits)
+                if missing_commits:
                     error_msg = (
                         f"Some commits from Bitbucket PR are missing in GitHub. "
                         f"Missing SHAs: {missing_commits[:5]}{'...' if len(missing_commits) > 5 else ''}. "
@@ -197,21 +580,18 @@ class GitHubClient:
             elif self.skip_commit_verification:
                 logger.info(f"Skipping commit verification for PR #{pr.id} (skip_commit_verification=true)")
             
+            if preflight:
+                existing_pr_numbers = preflight['existing_prs']
+            else:
+                existing_pr_numbers = self._existing_pr_numbers(pr)
             
-            existing_prs = self.repo.get_pulls(
-                state='open',
-                head=f"{self.owner}:{pr.source_branch}",
-                base=pr.destination_branch
-            )
-            
-            if existing_prs.totalCount > 0:
-                existing_pr_numbers = [p.number for p in list(existing_prs)[:3]]  # Show first 3
+            if existing_pr_numbers:
                 error_msg = f"PR already exists with head={pr.source_branch} and base={pr.destination_branch} (GitHub PR(s): {existing_pr_numbers})"
                 logger.warning(error_msg)
                 return False, error_msg
             
             # Build PR body with attribution
-            body = self._build_pr_body(pr)
+            body = body_future.result() if body_future else ""
             
             # Create the pull request with appropriate head format
             github_pr = self.repo.create_pull(
@@ -232,7 +612,7 @@ class GitHubClient:
             # Add reviewers
             self._add_reviewers(github_pr, pr.reviewers)
             
-            # Add comments and tasks together (tasks inserted after their parent comments)
+            # Add comments and tasks together (tasks appended to their parent comments)
             self._add_comments_and_tasks(github_pr, pr.comments, pr.tasks)
             
             return True, ""
@@ -270,9 +650,7 @@ class GitHubClient:
         Returns:
             Original PR description
         """
-        if pr.description:
-            return self.markdown_converter.convert_pr_description(pr.description)
-        return ""
+        return self.markdown_converter.convert_pr_description(pr.description)
     
     def _add_reviewers(self, github_pr, reviewers: List[PRReviewer]):
         """
@@ -286,21 +664,24 @@ class GitHubClient:
             logger.debug("No reviewers to add")
             return
         
-        logger.info(f"Processing {len(reviewers)} reviewer(s) for PR")
+        logger.info("Processing %d reviewer(s) for PR", len(reviewers))
         
         valid_reviewers = []
         invalid_reviewers = []
         unmapped_reviewers = []
         
-        for reviewer in reviewers:
-            logger.debug(f"Processing reviewer: {reviewer.username}")
-            mapped_username = self.user_mapper.get_github_user(reviewer.username)
+        mapped_usernames = [self.user_mapper.get_github_user(r.username) for r in reviewers]
+        # One collaborator set for the whole batch (only needed if anyone is mapped)
+        collaborators = self._collaborators() if any(mapped_usernames) else frozenset()
+        
+        for reviewer, mapped_username in zip(reviewers, mapped_usernames):
+            logger.debug("Processing reviewer: %s", reviewer.username)
             if mapped_username:
-                logger.info(f"Reviewer '{reviewer.username}' mapped to GitHub user '{mapped_username}'")
+                logger.info("Reviewer '%s' mapped to GitHub user '%s'", reviewer.username, mapped_username)
                 # Validate that the reviewer has access to the repository
-                if self._validate_reviewer(mapped_username):
+                if mapped_username.lower() in collaborators:
                     valid_reviewers.append(mapped_username)
-                    logger.info(f"✓ Reviewer '{mapped_username}' validated as collaborator")
+                    logger.info("✓ Reviewer '%s' validated as collaborator", mapped_username)
                 else:
                     logger.warning(f"✗ Reviewer '{mapped_username}' is not a repository collaborator")
                     invalid_reviewers.append({
@@ -315,9 +696,9 @@ class GitHubClient:
         # Request reviews from valid reviewers only
         if valid_reviewers:
             try:
-                logger.info(f"Requesting reviews from: {', '.join(valid_reviewers)}")
+                logger.info("Requesting reviews from: %s", ', '.join(valid_reviewers))
                 github_pr.create_review_request(reviewers=valid_reviewers)
-                logger.info(f"✓ Successfully added {len(valid_reviewers)} reviewer(s) to GitHub PR")
+                logger.info("✓ Successfully added %d reviewer(s) to GitHub PR", len(valid_reviewers))
             except GithubException as e:
                 # This should rarely happen now since we validated reviewers
                 logger.error(f"Failed to add reviewers: {e}")
@@ -366,23 +747,69 @@ class GitHubClient:
         Returns:
             True if user is a valid collaborator, False otherwise
         """
-        try:
-            # Check if user is a collaborator on the repository
-            # This includes org members with repo access and external collaborators
-            collaborators = self.repo.get_collaborators()
-            for collaborator in collaborators:
-                if collaborator.login.lower() == github_username.lower():
-                    return True
+        return github_username.lower() in self._collaborators()
+    
+    def _collaborators(self) -> FrozenSet[str]:
+        """
+        Lower-cased logins of the repository's collaborators
+        
+        Collaborators include org members with repo access and external
+        collaborators. The list is fetched once and refreshed after
+        COLLABORATOR_TTL seconds so long migrations see newly added users.
+        
+        Returns:
+            Frozen set of logins (empty if the list could not be fetched)
+        """
+        if self._collaborator_logins is None or time.monotonic() >= self._collaborators_expire_at:
+            with self._collaborator_lock:
+                if self._collaborator_logins is None or time.monotonic() >= self._collaborators_expire_at:
+                    try:
+                        self._collaborator_logins = self._fetch_collaborators()
+                        self._collaborators_expire_at = time.monotonic() + self.COLLABORATOR_TTL
+                    except GithubException as e:
+                        # Leave the cache as it is so the next check tries again
+                        logger.warning(f"Could not list repository collaborators: {e}")
+                        return self._collaborator_logins or frozenset()
+        
+        return self._collaborator_logins
+    
+    def _fetch_collaborators(self) -> FrozenSet[str]:
+        """Walk the collaborator pages, revalidating each against its last ETag"""
+        # Once the TTL expires the list is usually unchanged; a 304 costs no
+        # rate limit and reuses the logins cached for that page
+        logins: Set[str] = set()
+        page = 1
+        while True:
+            cached = self._collaborator_pages.get(page)
+            headers = {'If-None-Match': cached[0]} if cached and cached[0] else None
+            status, response_headers, output = self.github.requester.requestJson(
+                "GET", f"{self.repo.url}/collaborators",
+                parameters={'per_page': self.PER_PAGE, 'page': page}, headers=headers
+            )
+            self._note_rate_limit(response_headers)
             
-            return False
+            if status == 304 and cached:
+                page_logins = cached[1]
+            elif status == 200:
+                page_logins = frozenset(entry['login'].lower() for entry in json.loads(output))
+                self._collaborator_pages[page] = (response_headers.get('etag'), page_logins)
+            else:
+                raise GithubException(status, output, response_headers)
             
-        except GithubException as e:
-            return False
+            logins.update(page_logins)
+            if len(page_logins) < self.PER_PAGE:
+                break
+            page += 1
+        
+        # Drop pages past the end in case the list shrank
+        for stale_page in [p for p in self._collaborator_pages if p > page]:
+            del self._collaborator_pages[stale_page]
+        return frozenset(logins)
     
     def _add_comments_and_tasks(self, github_pr, comments: List[PRComment], tasks: List[PRTask]):
         """
         Add comments and tasks to GitHub PR with formatting preservation
-        Tasks are inserted right after their parent comment
+        Tasks are appended to their parent comment
         
         Args:
             github_pr: GitHub PR object
@@ -392,115 +819,244 @@ class GitHubClient:
         if not comments:
             return
         
-        # Build a mapping of Bitbucket account IDs to usernames for mention resolution
-        # Format: {"712020:uuid": "Username"}
+        # Build, in one pass, a mapping of Bitbucket account IDs to usernames for
+        # mention resolution ({"712020:uuid": "Username"}) and a mapping of
+        # comment IDs to (author, content) for reply quoting
         account_id_to_username = {}
+        comment_data_map = {}
         for comment in comments:
             if comment.author_email and comment.author:
                 # author_email contains the account ID like "712020:634d5063-6091-4f3c-8b08-64ccd298144d"
                 account_id_to_username[comment.author_email] = comment.author
+            comment_data_map[comment.id] = (comment.author, comment.content[:200])  # First 200 chars for quote preview
         
-        # Build a mapping of comment IDs to their content and authors for reply quoting
-        # Format: {comment_id: {"author": "Username", "content": "comment text"}}
-        comment_data_map = {}
-        for comment in comments:
-            comment_data_map[comment.id] = {
-                "author": comment.author,
-                "content": comment.content[:200]  # First 200 chars for quote preview
-            }
+        replace_mention = _MentionReplacer(account_id_to_username, self.user_mapper)
         
-        for comment in comments:
-            try:
-                # Build comment body
-                comment_body_parts = []
-                
-                # Add reply with quoted parent comment if this is a response
-                if comment.parent_id and comment.parent_id in comment_data_map:
-                    parent_data = comment_data_map[comment.parent_id]
-                    parent_author = parent_data["author"]
-                    parent_content = parent_data["content"]
-                    
-                    # Get mapped parent author or use original
-                    mapped_parent_author = self.user_mapper.get_github_user(parent_author)
-                    parent_display = f"@{mapped_parent_author}" if mapped_parent_author else parent_author
-                    
-                    # Format as GitHub quote block
-                    comment_body_parts.append(f"> {parent_display} wrote:\n")
-                    # Quote each line of parent content
-                    for line in parent_content.split('\n'):
-                        comment_body_parts.append(f"> {line}\n")
-                    comment_body_parts.append("\n")  # Blank line after quote
-                
-                # Add comment content (convert markdown)
-                converted_content = self.markdown_converter.convert_comment(comment.content)
-                
-                # Replace Bitbucket UUID mentions with actual usernames
-                # Pattern: @{712020:634d5063-6091-4f3c-8b08-64ccd298144d}
-                import re
-                def replace_uuid_mention(match):
-                    account_id = match.group(1)
-                    username = account_id_to_username.get(account_id)
-                    if username:
-                        # Try to get GitHub username mapping
-                        github_user = self.user_mapper.get_github_user(username)
-                        if github_user:
-                            return f"@{github_user}"
-                        return f"@{username}"
-                    return "*(user mention)*"  # Fallback if not found
-                
-                converted_content = re.sub(r'@\{([0-9]+:[a-f0-9-]+)\}', replace_uuid_mention, converted_content)
-                
-                comment_body_parts.append(converted_content)
-                
-                # Migrate attachments if present
-                if comment.attachments and self.image_migrator:
-                    comment_body_parts.append("\n\n---\n**Attachments:**\n")
-                    for attachment in comment.attachments:
-                        try:
-                            # Download and upload attachment
-                            github_url = self.image_migrator.migrate_attachment(
-                                attachment['url'], 
-                                attachment['name'],
-                                github_pr.number
-                            )
-                            if github_url:
-                                # Add attachment link to comment
-                                comment_body_parts.append(f"\n- [{attachment['name']}]({github_url})")
-                                logger.info(f"Migrated attachment: {attachment['name']}")
-                            else:
-                                comment_body_parts.append(f"\n- ⚠️ {attachment['name']} (migration failed)")
-                        except Exception as e:
-                            logger.error(f"Failed to migrate attachment {attachment['name']}: {e}")
-                            comment_body_parts.append(f"\n- ⚠️ {attachment['name']} (migration failed)")
-                
-                # Combine all parts
-                comment_body = "".join(comment_body_parts)
-                
-                # Migrate images in comment if image migrator is available
-                if self.image_migrator:
-                    comment_body = self.image_migrator.migrate_images_in_text(comment_body, github_pr.number)
-                
-                # Create comment
-                github_pr.create_issue_comment(comment_body)
-                logger.debug(f"Added comment {comment.id}")
+        # Index tasks by parent comment once instead of rescanning per comment
+        tasks_by_comment = defaultdict(list)
+        for task in tasks:
+            tasks_by_comment[task.comment_id].append(task)
+        
+        # Building a body may download and re-upload attachments and images, so
+        # bodies are prepared concurrently; they are still posted one at a time
+        # in the original order so replies land after their parents
+        body_futures = [
+            self._executor.submit(self._build_comment_body, comment, github_pr.number,
+                                  replace_mention, comment_data_map)
+            for comment in comments
+        ]
+        
+        def prepared_comments():
+            for comment, body_future in zip(comments, body_futures):
+                try:
+                    comment_body = body_future.result()
+                except GithubException as e:
+                    logger.error(f"Failed to add comment {comment.id}: {e}")
+                    continue
+                except Exception as e:
+                    logger.error(f"Unexpected error adding comment {comment.id}: {e}")
+                    continue
                 
                 # Check if any tasks are attached to this comment
-                comment_tasks = [t for t in tasks if t.comment_id == comment.id]
+                comment_tasks = tasks_by_comment.get(comment.id, ())
                 if comment_tasks:
-                    # Add tasks right after this comment
-                    task_lines = []
-                    for task in comment_tasks:
-                        checkbox = "[x]" if task.is_resolved() else "[ ]"
-                        task_lines.append(f"- {checkbox} {task.content}")
-                    
-                    task_body = "\n".join(task_lines)
-                    github_pr.create_issue_comment(task_body)
-                    logger.debug(f"Added {len(comment_tasks)} task(s) after comment {comment.id}")
+                    # Append tasks beneath the comment so both go out together
+                    comment_body += "\n\n---\n**Tasks:**\n" + "\n".join(
+                        f"- {'[x]' if task.is_resolved() else '[ ]'} {task.content}" for task in comment_tasks
+                    )
+                    logger.debug("Appending %d task(s) to comment %s", len(comment_tasks), comment.id)
+                
+                yield comment.id, comment_body
+        
+        self._post_comments(github_pr.node_id, prepared_comments(), github_pr.create_issue_comment)
+    
+    def _post_comments(self, subject_id: str, entries: Iterable[Tuple[str, str]],
+                       create_comment: Callable[[str], object], target: str = ""):
+        """
+        Post comments in order, COMMENT_BATCH_SIZE per GraphQL request
+        
+        Comments GraphQL rejected (e.g. "submitted too quickly") are re-posted
+        over REST. A batch is only re-posted as a whole when GitHub proves none
+        of it ran; after a 5xx or timeout some comments may exist already, so
+        the batch is reported instead of risking duplicates.
+        
+        Args:
+            subject_id: GraphQL node ID of the GitHub PR or issue
+            entries: (Bitbucket comment ID, body) pairs in posting order
+            create_comment: REST call used for comments GraphQL did not post
+            target: Suffix for log messages (e.g. " to issue")
+        """
+        entries = iter(entries)
+        while True:
+            batch = list(islice(entries, self.COMMENT_BATCH_SIZE))
+            if not batch:
+                return
             
+            try:
+                errors = self._add_comment_batch(subject_id, [body for _, body in batch])
             except GithubException as e:
-                logger.error(f"Failed to add comment {comment.id}: {e}")
+                if not self._nothing_executed(e):
+                    self._report_unknown_comments(batch, target, e)
+                    continue
+                # Nothing from this batch was posted, so REST keeps the order
+                logger.warning(f"GraphQL addComment failed, posting {len(batch)} comment(s) over REST: {e}")
+                errors = [str(e)] * len(batch)
+            except requests.exceptions.RequestException as e:
+                self._report_unknown_comments(batch, target, e)
+                continue
+            
+            for (comment_id, comment_body), error in zip(batch, errors):
+                if not error:
+                    logger.debug("Added comment %s%s", comment_id, target)
+                    continue
+                logger.debug("GraphQL did not add comment %s%s (%s), retrying over REST", comment_id, target, error)
+                try:
+                    self._rate_guard()
+                    create_comment(comment_body)
+                    logger.debug("Added comment %s%s", comment_id, target)
+                except GithubException as e:
+                    logger.error(f"Failed to add comment {comment_id}{target}: {e}")
+                except Exception as e:
+                    logger.error(f"Unexpected error adding comment {comment_id}{target}: {e}")
+    
+    @staticmethod
+    def _nothing_executed(error: GithubException) -> bool:
+        """Whether a failed GraphQL request provably ran no mutation (errors payload, data null, no 5xx)"""
+        data = error.data if isinstance(error.data, dict) else {}
+        return (error.status is not None and error.status < 500
+                and bool(data.get('errors')) and data.get('data') is None)
+    
+    @staticmethod
+    def _report_unknown_comments(batch: List[Tuple[str, str]], target: str, error: Exception):
+        """Log a batch whose outcome is unknown; re-posting it could duplicate comments"""
+        for comment_id, _ in batch:
+            logger.error(f"Comment {comment_id}{target} may not have been added (not retried to avoid duplicates): {error}")
+    
+    def _add_comment_batch(self, subject_id: str, bodies: List[str]) -> List[Optional[str]]:
+        """
+        Add comments with one aliased GraphQL mutation per body
+        
+        Args:
+            subject_id: GraphQL node ID of the GitHub PR or issue
+            bodies: Comment bodies in posting order
+            
+        Returns:
+            Per-body error message, None for each comment that was posted
+            
+        Raises:
+            GithubException: If the response carries no per-comment results
+        """
+        declarations = ["$subject: ID!"]
+        variables = {'subject': subject_id}
+        fields = []
+        for index, body in enumerate(bodies):
+            declarations.append(f"$b{index}: String!")
+            variables[f"b{index}"] = body
+            fields.append(f"c{index}: addComment(input: {{subjectId: $subject, body: $b{index}}}) {{ clientMutationId }}")
+        query = f"mutation({', '.join(declarations)}) {{ {' '.join(fields)} }}"
+        
+        try:
+            data = self._graphql(query, variables)
+        except GithubException as e:
+            # A failed mutation nulls its own alias; the others still run
+            data = e.data if isinstance(e.data, dict) else {}
+            if not isinstance(data.get('data'), dict):
+                raise
+        
+        errors = {}
+        for error in data.get('errors') or ():
+            path = error.get('path') or ()
+            if path:
+                errors[path[0]] = error.get('message')
+        results = data.get('data') or {}
+        return [
+            None if results.get(f"c{index}") else errors.get(f"c{index}", "no result returned")
+            for index in range(len(bodies))
+        ]
+    
+    def _build_comment_body(self, comment: PRComment, pr_number: int,
+                            replace_mention: _MentionReplacer, comment_data_map: dict) -> str:
+        """
+        Build the GitHub body for a single PR comment
+        
+        Args:
+            comment: PRComment object
+            pr_number: GitHub PR number (for attachment/image uploads)
+            replace_mention: Resolver for Bitbucket UUID mentions
+            comment_data_map: Comment ID to (author, content preview) map for reply quotes
+            
+        Returns:
+            Comment body in GitHub markdown
+        """
+        # Build comment body
+        body_buffer = io.StringIO()
+        
+        # Add reply with quoted parent comment if this is a response
+        if comment.parent_id and comment.parent_id in comment_data_map:
+            parent_author, parent_content = comment_data_map[comment.parent_id]
+            
+            # Get mapped parent author or use original
+            mapped_parent_author = self.user_mapper.get_github_user(parent_author)
+            parent_display = f"@{mapped_parent_author}" if mapped_parent_author else parent_author
+            
+            # Format as GitHub quote block
+            body_buffer.write(f"> {parent_display} wrote:\n")
+            # Quote each line of parent content
+            body_buffer.write("> ")
+            body_buffer.write(parent_content.replace("\n", "\n> "))
+            body_buffer.write("\n\n")  # Blank line after quote
+        
+        # Add comment content (convert markdown)
+        converted_content = self.markdown_converter.convert_comment(comment.content)
+        
+        # Replace Bitbucket UUID mentions with actual usernames
+        converted_content = _UUID_MENTION_RE.sub(replace_mention, converted_content)
+        
+        body_buffer.write(converted_content)
+        
+        comment_body = body_buffer.getvalue()
+        
+        # Migrate images in comment if image migrator is available (before the
+        # attachment footer is added, which never contains image markdown)
+        if self.image_migrator:
+            comment_body = self.image_migrator.migrate_images_in_text(comment_body, pr_number)
+            
+            # Migrate attachments if present
+            if comment.attachments:
+                comment_body += self._attachments_footer(comment.attachments, pr_number)
+        
+        return comment_body
+    
+    def _attachments_footer(self, attachments: List[dict], number: int) -> str:
+        """
+        Migrate comment attachments and build the footer listing them
+        
+        Args:
+            attachments: Attachment dicts with 'name' and 'url'
+            number: GitHub PR/issue number (for upload paths)
+            
+        Returns:
+            Markdown footer with a link (or failure note) per attachment
+        """
+        footer = ["\n\n---\n**Attachments:**\n"]
+        for attachment in attachments:
+            try:
+                # Download and upload attachment
+                github_url = self.image_migrator.migrate_attachment(
+                    attachment['url'], 
+                    attachment['name'],
+                    number
+                )
+                if github_url:
+                    # Add attachment link to comment
+                    footer.append(f"\n- [{attachment['name']}]({github_url})")
+                    logger.info(f"Migrated attachment: {attachment['name']}")
+                else:
+                    footer.append(f"\n- ⚠️ {attachment['name']} (migration failed)")
             except Exception as e:
-                logger.error(f"Unexpected error adding comment {comment.id}: {e}")
+                logger.error(f"Failed to migrate attachment {attachment['name']}: {e}")
+                footer.append(f"\n- ⚠️ {attachment['name']} (migration failed)")
+        return "".join(footer)
     
     def create_closed_issue(self, pr: PullRequest) -> tuple[bool, str]:
         """
@@ -513,6 +1069,8 @@ class GitHubClient:
             Tuple of (success: bool, error_message: str)
         """
         try:
+            self._rate_guard()
+            
             # Build issue title
             title = f"[Closed PR #{pr.id}] {pr.title}"
             
@@ -601,109 +1159,102 @@ class GitHubClient:
         
         # Build mappings
         account_id_to_username = {}
+        comment_data_map = {}
         for comment in comments:
             if comment.author_email and comment.author:
                 account_id_to_username[comment.author_email] = comment.author
+            comment_data_map[comment.id] = (comment.author, comment.content[:200])
         
-        comment_data_map = {}
-        for comment in comments:
-            comment_data_map[comment.id] = {
-                "author": comment.author,
-                "content": comment.content[:200]
-            }
+        replace_mention = _MentionReplacer(account_id_to_username, self.user_mapper)
         
-        for comment in comments:
-            try:
-                # Build comment body
-                comment_body_parts = []
-                
-                # Add comment metadata with IST timestamp
-                mapped_author = self.user_mapper.get_github_user(comment.author)
-                author_display = f"@{mapped_author}" if mapped_author else comment.author
-                comment_body_parts.append(f"**{author_display}** commented on {self._utc_to_ist(comment.created_date)}")
-                if comment.updated_date and comment.updated_date != comment.created_date:
-                    comment_body_parts.append(f" *(edited {self._utc_to_ist(comment.updated_date)})*")
-                comment_body_parts.append("\n\n")
-                
-                # Add reply quote if present
-                if comment.parent_id and comment.parent_id in comment_data_map:
-                    parent_data = comment_data_map[comment.parent_id]
-                    parent_author = parent_data["author"]
-                    parent_content = parent_data["content"]
-                    
-                    mapped_parent_author = self.user_mapper.get_github_user(parent_author)
-                    parent_display = f"@{mapped_parent_author}" if mapped_parent_author else parent_author
-                    
-                    comment_body_parts.append(f"> {parent_display} wrote:\n")
-                    for line in parent_content.split('\n'):
-                        comment_body_parts.append(f"> {line}\n")
-                    comment_body_parts.append("\n")
-                
-                # Add inline comment context if present
-                if comment.inline:
-                    file_path = comment.inline.get('path', 'unknown')
-                    from_line = comment.inline.get('from')
-                    to_line = comment.inline.get('to')
-                    if from_line and to_line:
-                        comment_body_parts.append(f"📄 **Inline comment on** `{file_path}` (lines {from_line}-{to_line})\n\n")
-                    else:
-                        comment_body_parts.append(f"📄 **Inline comment on** `{file_path}`\n\n")
-                
-                # Add content
-                converted_content = self.markdown_converter.convert_comment(comment.content)
-                
-                # Replace UUID mentions
-                import re
-                def replace_uuid_mention(match):
-                    account_id = match.group(1)
-                    username = account_id_to_username.get(account_id)
-                    if username:
-                        github_user = self.user_mapper.get_github_user(username)
-                        if github_user:
-                            return f"@{github_user}"
-                        return f"@{username}"
-                    return "*(user mention)*"
-                
-                converted_content = re.sub(r'@\{([0-9]+:[a-f0-9-]+)\}', replace_uuid_mention, converted_content)
-                comment_body_parts.append(converted_content)
-                
-                # Migrate attachments if present
-                if comment.attachments and self.image_migrator:
-                    comment_body_parts.append("\n\n---\n**Attachments:**\n")
-                    for attachment in comment.attachments:
-                        try:
-                            github_url = self.image_migrator.migrate_attachment(
-                                attachment['url'], 
-                                attachment['name'],
-                                github_issue.number
-                            )
-                            if github_url:
-                                comment_body_parts.append(f"\n- [{attachment['name']}]({github_url})")
-                                logger.info(f"Migrated attachment: {attachment['name']}")
-                            else:
-                                comment_body_parts.append(f"\n- ⚠️ {attachment['name']} (migration failed)")
-                        except Exception as e:
-                            logger.error(f"Failed to migrate attachment {attachment['name']}: {e}")
-                            comment_body_parts.append(f"\n- ⚠️ {attachment['name']} (migration failed)")
-                
-                comment_body = "".join(comment_body_parts)
-                
-                # Migrate images
-                if self.image_migrator:
-                    comment_body = self.image_migrator.migrate_images_in_text(comment_body, github_issue.number)
-                
-                # Create comment
-                github_issue.create_comment(comment_body)
-                logger.debug(f"Added comment {comment.id} to issue")
+        # Bodies (attachments, images, markdown) are prepared concurrently and
+        # posted one at a time in the original order
+        body_futures = [
+            self._executor.submit(self._build_issue_comment_body, comment, github_issue.number,
+                                  replace_mention, comment_data_map)
+            for comment in comments
+        ]
+        
+        def prepared_comments():
+            for comment, body_future in zip(comments, body_futures):
+                try:
+                    yield comment.id, body_future.result()
+                except GithubException as e:
+                    logger.error(f"Failed to add comment {comment.id} to issue: {e}")
+                except Exception as e:
+                    logger.error(f"Unexpected error adding comment {comment.id} to issue: {e}")
+        
+        self._post_comments(github_issue.node_id, prepared_comments(), github_issue.create_comment, " to issue")
+    
+    def _build_issue_comment_body(self, comment: PRComment, issue_number: int,
+                                  replace_mention: _MentionReplacer, comment_data_map: dict) -> str:
+        """
+        Build the GitHub body for a single closed-issue comment
+        
+        Args:
+            comment: PRComment object
+            issue_number: GitHub issue number (for attachment/image uploads)
+            replace_mention: Resolver for Bitbucket UUID mentions
+            comment_data_map: Comment ID to (author, content preview) map for reply quotes
             
-            except GithubException as e:
-                logger.error(f"Failed to add comment {comment.id} to issue: {e}")
-            except Exception as e:
-                logger.error(f"Unexpected error adding comment {comment.id} to issue: {e}")
+        Returns:
+            Comment body in GitHub markdown, with author and timestamp header
+        """
+        # Build comment body
+        body_buffer = io.StringIO()
+        
+        # Add comment metadata with IST timestamp
+        mapped_author = self.user_mapper.get_github_user(comment.author)
+        author_display = f"@{mapped_author}" if mapped_author else comment.author
+        body_buffer.write(f"**{author_display}** commented on {self._utc_to_ist(comment.created_date)}")
+        if comment.updated_date and comment.updated_date != comment.created_date:
+            body_buffer.write(f" *(edited {self._utc_to_ist(comment.updated_date)})*")
+        body_buffer.write("\n\n")
+        
+        # Add reply quote if present
+        if comment.parent_id and comment.parent_id in comment_data_map:
+            parent_author, parent_content = comment_data_map[comment.parent_id]
+            
+            mapped_parent_author = self.user_mapper.get_github_user(parent_author)
+            parent_display = f"@{mapped_parent_author}" if mapped_parent_author else parent_author
+            
+            body_buffer.write(f"> {parent_display} wrote:\n")
+            body_buffer.write("> ")
+            body_buffer.write(parent_content.replace("\n", "\n> "))
+            body_buffer.write("\n\n")
+        
+        # Add inline comment context if present
+        if comment.inline:
+            file_path = comment.inline.get('path', 'unknown')
+            from_line = comment.inline.get('from')
+            to_line = comment.inline.get('to')
+            if from_line and to_line:
+                body_buffer.write(f"📄 **Inline comment on** `{file_path}` (lines {from_line}-{to_line})\n\n")
+            else:
+                body_buffer.write(f"📄 **Inline comment on** `{file_path}`\n\n")
+        
+        # Add content
+        converted_content = self.markdown_converter.convert_comment(comment.content)
+        
+        # Replace UUID mentions
+        converted_content = _UUID_MENTION_RE.sub(replace_mention, converted_content)
+        body_buffer.write(converted_content)
+        
+        comment_body = body_buffer.getvalue()
+        
+        # Migrate images (the attachment footer is appended afterwards)
+        if self.image_migrator:
+            comment_body = self.image_migrator.migrate_images_in_text(comment_body, issue_number)
+            
+            # Migrate attachments if present
+            if comment.attachments:
+                comment_body += self._attachments_footer(comment.attachments, issue_number)
+        
+        return comment_body
     
     def _add_tasks_to_issue(self, github_issue, tasks: List[PRTask]):
         """
-        Add tasks to GitHub issue as a formatted comment
+        Add tasks to GitHub issue as a single formatted comment
         
         Args:
             github_issue: GitHub Issue object
@@ -713,45 +1264,43 @@ class GitHubClient:
             return
         
         try:
-            # Group tasks by comment ID
-            comment_tasks = {}
+            # Group tasks by comment ID, and resolve each creator's display
+            # name once rather than per task
+            comment_tasks = defaultdict(list)
             orphan_tasks = []
+            creator_displays = {}
             
             for task in tasks:
                 if task.comment_id:
-                    if task.comment_id not in comment_tasks:
-                        comment_tasks[task.comment_id] = []
                     comment_tasks[task.comment_id].append(task)
                 else:
                     orphan_tasks.append(task)
+                if task.creator not in creator_displays:
+                    mapped_creator = self.user_mapper.get_github_user(task.creator)
+                    creator_displays[task.creator] = f"@{mapped_creator}" if mapped_creator else task.creator
+            
+            def format_task(task: PRTask) -> str:
+                checkbox = "[x]" if task.is_resolved() else "[ ]"
+                return (f"- {checkbox} {task.content} "
+                        f"*(by {creator_displays[task.creator]} on {self._utc_to_ist(task.created_date)})*\n")
+            
+            task_sections = []
             
             # Add tasks grouped by comment
             for comment_id, task_list in comment_tasks.items():
-                task_body_parts = [f"**📋 Tasks from comment {comment_id}:**\n\n"]
-                for task in task_list:
-                    checkbox = "[x]" if task.is_resolved() else "[ ]"
-                    mapped_creator = self.user_mapper.get_github_user(task.creator)
-                    creator_display = f"@{mapped_creator}" if mapped_creator else task.creator
-                    task_body_parts.append(f"- {checkbox} {task.content} *(by {creator_display} on {self._utc_to_ist(task.created_date)})*\n")
-                
-                github_issue.create_comment("".join(task_body_parts))
-                logger.debug(f"Added {len(task_list)} task(s) from comment {comment_id}")
+                task_sections.append(f"**📋 Tasks from comment {comment_id}:**\n\n"
+                                     + "".join(map(format_task, task_list)))
             
             # Add orphan tasks (not attached to any comment)
             if orphan_tasks:
-                task_body_parts = ["**📋 Tasks:**\n\n"]
-                for task in orphan_tasks:
-                    checkbox = "[x]" if task.is_resolved() else "[ ]"
-                    mapped_creator = self.user_mapper.get_github_user(task.creator)
-                    creator_display = f"@{mapped_creator}" if mapped_creator else task.creator
-                    task_body_parts.append(f"- {checkbox} {task.content} *(by {creator_display} on {self._utc_to_ist(task.created_date)})*\n")
-                
-                github_issue.create_comment("".join(task_body_parts))
-                logger.debug(f"Added {len(orphan_tasks)} orphan task(s)")
+                task_sections.append("**📋 Tasks:**\n\n" + "".join(map(format_task, orphan_tasks)))
+            
+            # All task groups go out as one comment rather than one per group
+            self._rate_guard()
+            github_issue.create_comment("\n".join(task_sections))
+            logger.debug(f"Added {len(tasks)} task(s) in {len(task_sections)} group(s)")
         
         except GithubException as e:
             logger.error(f"Failed to add tasks to issue: {e}")
         except Exception as e:
             logger.error(f"Unexpected error adding tasks to issue: {e}")
-
-
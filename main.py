@@ -2,42 +2,58 @@
 Main application for Bitbucket to GitHub PR migration
 """
 import sys
+import atexit
 import logging
-import yaml
+import logging.handlers
+import queue
 import argparse
 import os
 import shutil
 import getpass
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
 from datetime import datetime
-from typing import Dict, List, Optional
-from tqdm import tqdm
-from github import Github, Auth, GithubException
-from clients import BitbucketClient, GitHubClient
+from typing import Dict, List, Optional, Union
 from models import PullRequest
-from utils import UserMapper, PRLogger
+
+# PyGithub, requests, PyYAML, tqdm and the API clients are imported where they
+# are used, so `--help` and argument errors don't pay for loading them
+
+
+# (section, fields) that validate_config requires to be present and non-empty
+_REQUIRED_FIELDS = (
+    ('bitbucket', ('workspace', 'repository')),
+    ('github', ('owner', 'repository', 'token')),
+)
+
+
+def _yaml_loader():
+    """libyaml's CSafeLoader when PyYAML was built with it, else the pure-Python SafeLoader"""
+    try:
+        from yaml import CSafeLoader as YamlLoader
+    except ImportError:  # PyYAML built without libyaml
+        from yaml import SafeLoader as YamlLoader
+    return YamlLoader
 
 
 def validate_bitbucket_credentials(workspace, repository, auth_data):
     """Validate Bitbucket credentials by making a test API call"""
     import requests
+    from clients import BitbucketClient
     
     try:
         headers = {'Accept': 'application/json'}
         
         if 'oauth_key' in auth_data and 'oauth_secret' in auth_data:
-            # Get OAuth token
-            token_response = requests.post(
-                "https://bitbucket.org/site/oauth2/access_token",
-                auth=(auth_data['oauth_key'], auth_data['oauth_secret']),
-                data={'grant_type': 'client_credentials'},
-                timeout=10
-            )
-            
-            if token_response.status_code != 200:
+            # Always request a fresh token so Bitbucket itself checks the secret
+            try:
+                access_token = BitbucketClient.get_oauth_token(
+                    auth_data['oauth_key'], auth_data['oauth_secret'], use_cached=False
+                )
+            except requests.exceptions.HTTPError:
                 return False, "Invalid OAuth credentials. Please check your Consumer Key and Secret."
             
-            token_data = token_response.json()
-            access_token = token_data['access_token']
             headers['Authorization'] = f'Bearer {access_token}'
         else:
             # Use Bearer token
@@ -109,7 +125,8 @@ def create_config_interactive():
         'migration_options': {
             'skip_commit_verification': False,
             'skip_prs_with_missing_branches': True,
-            'create_closed_issues': True
+            'create_closed_issues': True,
+            'pr_concurrency': 1
         },
         'test_mode': {
             'enabled': False,
@@ -208,6 +225,7 @@ def create_config_interactive():
             print("Please try again.\n")
     
     # Save configuration
+    import yaml
     with open('config.yaml', 'w', encoding='utf-8') as f:
         yaml.dump(config, f, default_flow_style=False, sort_keys=False)
     
@@ -235,17 +253,22 @@ def create_config_interactive():
 
 
 # Configure logging
-def setup_logging(log_file: str = './logs/migration_summary.log', verbose: bool = False):
+def setup_logging(log_file: str = './logs/migration_summary.log', verbose: bool = False,
+                  file_level: Union[str, int] = 'DEBUG'):
     """Setup logging configuration for production-grade output"""
     # Ensure logs directory exists
     log_dir = os.path.dirname(log_file)
-    if log_dir and not os.path.exists(log_dir):
+    if log_dir:
         os.makedirs(log_dir, exist_ok=True)
     
     # File logging - detailed technical logs
     file_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
-    file_handler.setLevel(logging.DEBUG)
+    # logging.level may be a name ("info") or a number (20); anything else
+    # (e.g. a typo like "VERBOSE") falls back to DEBUG instead of crashing
+    level = file_level if isinstance(file_level, int) else logging.getLevelName(str(file_level).upper())
+    invalid_level = not isinstance(level, int)
+    file_handler.setLevel(logging.DEBUG if invalid_level else level)
     file_handler.setFormatter(logging.Formatter(file_format))
     
     # Console logging - production-grade user-friendly output
@@ -254,22 +277,44 @@ def setup_logging(log_file: str = './logs/migration_summary.log', verbose: bool
     console_format = '%(message)s'
     console_handler.setFormatter(logging.Formatter(console_format))
     
-    # Configure root logger
+    # Callers (including the PR worker threads) only enqueue records; a
+    # background listener does the formatting and the file/console writes.
+    # Stopped at exit so queued records are flushed, even after sys.exit().
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # The queue handler only merges the message arguments (and traceback);
+    # the real formats are applied by the handlers above
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    # Configure root logger at the most verbose handler's level, so calls
+    # below it return at isEnabledFor() without building a record
     logging.basicConfig(
-        level=logging.DEBUG,
-        handlers=[file_handler, console_handler]
+        level=min(file_handler.level, console_handler.level),
+        handlers=[queue_handler]
     )
     
     # Suppress verbose output from third-party libraries
     logging.getLogger('urllib3').setLevel(logging.WARNING)
     logging.getLogger('github').setLevel(logging.WARNING)
     logging.getLogger('requests').setLevel(logging.WARNING)
+    
+    if invalid_level:
+        logging.getLogger(__name__).warning(
+            "Unknown logging level %r in config, using DEBUG for the log file", file_level
+        )
 
 
 class PRMigrationOrchestrator:
     """Orchestrates the PR migration process"""
     
-    def __init__(self, config_file: str = "config.yaml", dry_run: bool = False, test_mode: bool = False, pr_numbers: Optional[List[int]] = None):
+    def __init__(self, config_file: str = "config.yaml", dry_run: bool = False, test_mode: bool = False,
+                 pr_numbers: Optional[List[int]] = None, config: Optional[dict] = None):
         """
         Initialize the migration orchestrator
         
@@ -278,9 +323,10 @@ class PRMigrationOrchestrator:
             dry_run: If True, no changes will be made to GitHub
             test_mode: If True, use test repository from config
             pr_numbers: Optional list of specific PR numbers to migrate
+            config: Already-parsed configuration (config_file is not read if given)
         """
         self.logger = logging.getLogger(__name__)
-        self.config = self._load_config(config_file)
+        self.config = config if config is not None else self.load_config(config_file)
         self.dry_run = dry_run
         self.test_mode = test_mode
         self.pr_numbers = pr_numbers
@@ -305,6 +351,9 @@ class PRMigrationOrchestrator:
             self.logger.error("=" * 70 + "\n")
             sys.exit(1)
         
+        from clients import BitbucketClient, GitHubClient
+        from utils import UserMapper, PRLogger
+        
         # Initialize components
         self.user_mapper = UserMapper()
         self.pr_logger = PRLogger(
@@ -320,7 +369,9 @@ class PRMigrationOrchestrator:
                 workspace=self.config['bitbucket']['workspace'],
                 repository=self.config['bitbucket']['repository'],
                 oauth_key=self.config['bitbucket']['oauth_key'],
-                oauth_secret=self.config['bitbucket']['oauth_secret']
+                oauth_secret=self.config['bitbucket']['oauth_secret'],
+                pagelen=self.config['bitbucket'].get('pagelen', BitbucketClient.PAGELEN),
+                use_cache=self.config['bitbucket'].get('response_cache', True)
             )
             # Get OAuth access token for image migration
             bitbucket_token = self.bitbucket_client.access_token
@@ -328,7 +379,9 @@ class PRMigrationOrchestrator:
             self.bitbucket_client = BitbucketClient(
                 workspace=self.config['bitbucket']['workspace'],
                 repository=self.config['bitbucket']['repository'],
-                token=self.config['bitbucket']['token']
+                token=self.config['bitbucket']['token'],
+                pagelen=self.config['bitbucket'].get('pagelen', BitbucketClient.PAGELEN),
+                use_cache=self.config['bitbucket'].get('response_cache', True)
             )
             bitbucket_token = self.config['bitbucket']['token']
         
@@ -337,6 +390,7 @@ class PRMigrationOrchestrator:
         skip_commit_verification = migration_options.get('skip_commit_verification', False)
         skip_prs_with_missing_branches = migration_options.get('skip_prs_with_missing_branches', False)
         self.create_closed_issues_enabled = migration_options.get('create_closed_issues', True)  # Default: True
+        self.pr_concurrency = max(1, int(migration_options.get('pr_concurrency', 1)))
         
         self.github_client = GitHubClient(
             token=self.config['github']['token'],
@@ -346,7 +400,8 @@ class PRMigrationOrchestrator:
             bitbucket_repo=self.config['bitbucket']['repository'],
             bitbucket_token=bitbucket_token,
             skip_commit_verification=skip_commit_verification,
-            skip_prs_with_missing_branches=skip_prs_with_missing_branches
+            skip_prs_with_missing_branches=skip_prs_with_missing_branches,
+            user_mapper=self.user_mapper
         )
         
         # Migration statistics
@@ -359,6 +414,9 @@ class PRMigrationOrchestrator:
             'closed_issues_created': 0,
             'closed_issues_failed': 0
         }
+        
+        # (PR list, its open/closed split) from the last separate_prs call
+        self._categorized_prs: Optional[tuple] = None
     
     def _enable_test_mode(self):
         """Enable test mode using test repository from config"""
@@ -380,18 +438,22 @@ class PRMigrationOrchestrator:
         self.logger.warning(f"TEST MODE: PRs will be created in {test_repo['owner']}/{test_repo['repository']}")
         self.logger.warning("*" * 70 + "\n")
     
-    def _load_config(self, config_file: str) -> dict:
+    @staticmethod
+    def load_config(config_file: str) -> dict:
         """Load configuration from YAML file"""
+        import yaml
+        
+        logger = logging.getLogger(__name__)
         try:
             with open(config_file, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=_yaml_loader())
         except FileNotFoundError:
             # Config doesn't exist - this should be handled by main() before creating orchestrator
-            self.logger.error(f"Configuration file not found: {config_file}")
-            self.logger.error("Please run the tool to create configuration interactively.")
+            logger.error(f"Configuration file not found: {config_file}")
+            logger.error("Please run the tool to create configuration interactively.")
             sys.exit(1)
         except Exception as e:
-            self.logger.error(f"Error loading configuration: {e}")
+            logger.error(f"Error loading configuration: {e}")
             sys.exit(1)
     
     def validate_config(self) -> bool:
@@ -401,22 +463,19 @@ class PRMigrationOrchestrator:
         Returns:
             True if valid, False otherwise
         """
-        required_fields = {
-            'bitbucket': ['workspace', 'repository'],
-            'github': ['owner', 'repository', 'token']
-        }
-        
         missing_fields = []
         empty_fields = []
         
-        for section, fields in required_fields.items():
-            if section not in self.config:
-                for field in fields:
-                    missing_fields.append(f"{section}.{field}")
+        for section, fields in _REQUIRED_FIELDS:
+            # One lookup per section; a missing or empty section reports all
+            # of its fields at once
+            section_config = self.config.get(section)
+            if not section_config:
+                missing_fields.extend(f"{section}.{field}" for field in fields)
                 continue
-                
+            
             for field in fields:
-                value = self.config.get(section, {}).get(field)
+                value = section_config.get(field)
                 if value is None:
                     missing_fields.append(f"{section}.{field}")
                 elif isinstance(value, str) and value.strip() == "":
@@ -433,7 +492,7 @@ class PRMigrationOrchestrator:
                 self.logger.error(f"  - {field}")
         
         # Check Bitbucket authentication: either OAuth OR token
-        bb_config = self.config.get('bitbucket', {})
+        bb_config = self.config.get('bitbucket') or {}
         has_oauth = ('oauth_key' in bb_config and bb_config['oauth_key'] and 
                      'oauth_secret' in bb_config and bb_config['oauth_secret'])
         has_token = 'token' in bb_config and bb_config['token']
@@ -454,60 +513,31 @@ class PRMigrationOrchestrator:
             True if all credentials are valid, False otherwise
         """
         import requests
-        from github import GithubException
+        from github import Github, Auth, GithubException
         
         # Validate Bitbucket credentials
         try:
             print("   • Testing Bitbucket connection...")
             
-            # Support both OAuth 2.0 and Bearer token
-            headers = {'Accept': 'application/json'}
             bb_workspace = self.config['bitbucket']['workspace']
             bb_repo = self.config['bitbucket']['repository']
             
-            if 'oauth_key' in self.config['bitbucket'] and 'oauth_secret' in self.config['bitbucket']:
-                # Use OAuth 2.0 client credentials flow
-                oauth_key = self.config['bitbucket']['oauth_key']
-                oauth_secret = self.config['bitbucket']['oauth_secret']
-                
-                # Get access token
-                token_response = requests.post(
-                    "https://bitbucket.org/site/oauth2/access_token",
-                    auth=(oauth_key, oauth_secret),
-                    data={'grant_type': 'client_credentials'},
-                    timeout=10
-                )
-                
-                if token_response.status_code != 200:
-                    print(f"     ❌ Bitbucket OAuth authentication failed")
-                    print(f"     Check OAuth consumer credentials at:")
-                    print(f"     https://bitbucket.org/{bb_workspace}/workspace/settings/api")
-                    return False
-                
-                token_data = token_response.json()
-                access_token = token_data['access_token']
-                headers['Authorization'] = f'Bearer {access_token}'
-            else:
-                # Use Bearer token directly
-                bb_token = self.config['bitbucket']['token']
-                headers['Authorization'] = f'Bearer {bb_token}'
-            
-            # Test API call to verify authentication
-            test_url = f"https://api.bitbucket.org/2.0/repositories/{bb_workspace}/{bb_repo}"
-            response = requests.get(test_url, headers=headers, timeout=10)
+            # The client already holds a token (OAuth 2.0 or Bearer) and a pooled
+            # session; checking through it warms the connection the PR fetch uses
+            status_code = self.bitbucket_client.get_repository_status()
             
-            if response.status_code == 200:
+            if status_code == 200:
                 print(f"     ✓ Bitbucket: Connected to {bb_workspace}/{bb_repo}")
-            elif response.status_code == 401:
+            elif status_code == 401:
                 print(f"     ❌ Bitbucket: Authentication failed (401 Unauthorized)")
                 print(f"     Token is invalid or lacks permissions")
                 return False
-            elif response.status_code == 404:
+            elif status_code == 404:
                 print(f"     ❌ Bitbucket: Repository not found")
                 print(f"     Workspace: {bb_workspace}, Repository: {bb_repo}")
                 return False
             else:
-                print(f"     ❌ Bitbucket: Unexpected error (HTTP {response.status_code})")
+                print(f"     ❌ Bitbucket: Unexpected error (HTTP {status_code})")
                 return False
                 
         except requests.exceptions.Timeout:
@@ -528,7 +558,6 @@ class PRMigrationOrchestrator:
         try:
             print("   • Testing GitHub connection...")
             
-            from github import Auth
             auth = Auth.Token(gh_token)
             github = Github(auth=auth, timeout=10)
             repo = github.get_repo(f"{gh_owner}/{gh_repo}")
@@ -860,12 +889,11 @@ class PRMigrationOrchestrator:
         all_prs = self.bitbucket_client.get_all_pull_requests()
         self.stats['total_prs'] = len(all_prs)
         
-        # Categorize PRs
-        open_prs = [pr for pr in all_prs if pr.is_open()]
-        closed_prs = [pr for pr in all_prs if pr.is_closed()]
+        # Categorize PRs (kept for separate_prs)
+        categorized_prs = self.separate_prs(all_prs)
         
-        self.stats['open_prs'] = len(open_prs)
-        self.stats['closed_prs'] = len(closed_prs)
+        self.stats['open_prs'] = len(categorized_prs['open'])
+        self.stats['closed_prs'] = len(categorized_prs['closed'])
         
         return all_prs
     
@@ -885,7 +913,7 @@ class PRMigrationOrchestrator:
                 pr = self.bitbucket_client.get_pull_request(pr_num)
                 if pr:
                     prs.append(pr)
-                    self.logger.info(f"  ✓ Fetched PR #{pr_num}: {pr.title}")
+                    self.logger.info("  ✓ Fetched PR #%s: %s", pr_num, pr.title)
                 else:
                     self.logger.warning(f"  ✗ PR #{pr_num} not found")
             except Exception as e:
@@ -893,12 +921,11 @@ class PRMigrationOrchestrator:
         
         self.stats['total_prs'] = len(prs)
         
-        # Categorize PRs
-        open_prs = [pr for pr in prs if pr.is_open()]
-        closed_prs = [pr for pr in prs if pr.is_closed()]
+        # Categorize PRs (kept for separate_prs)
+        categorized_prs = self.separate_prs(prs)
         
-        self.stats['open_prs'] = len(open_prs)
-        self.stats['closed_prs'] = len(closed_prs)
+        self.stats['open_prs'] = len(categorized_prs['open'])
+        self.stats['closed_prs'] = len(categorized_prs['closed'])
         
         return prs
     
@@ -912,10 +939,20 @@ class PRMigrationOrchestrator:
         Returns:
             Dictionary with 'open' and 'closed' lists
         """
-        return {
-            'open': [pr for pr in all_prs if pr.is_open()],
-            'closed': [pr for pr in all_prs if pr.is_closed()]
-        }
+        # The fetch methods already split the list they return
+        if self._categorized_prs is not None and self._categorized_prs[0] is all_prs:
+            return self._categorized_prs[1]
+        
+        open_prs, closed_prs = [], []
+        for pr in all_prs:
+            if pr.is_open():
+                open_prs.append(pr)
+            elif pr.is_closed():
+                closed_prs.append(pr)
+        
+        categorized_prs = {'open': open_prs, 'closed': closed_prs}
+        self._categorized_prs = (all_prs, categorized_prs)
+        return categorized_prs
     
     def log_closed_prs(self, closed_prs: List[PullRequest]):
         """
@@ -924,8 +961,7 @@ class PRMigrationOrchestrator:
         Args:
             closed_prs: List of closed pull requests
         """
-        for pr in closed_prs:
-            self.pr_logger.log_closed_pr(pr)
+        self.pr_logger.log_closed_prs(closed_prs)
     
     def create_closed_issues(self, closed_prs: List[PullRequest]):
         """
@@ -945,6 +981,8 @@ class PRMigrationOrchestrator:
         
         print(f"\n📝 Creating GitHub issues for {len(closed_prs)} closed PRs...")
         
+        from tqdm import tqdm
+        
         # Progress bar for closed issues
         with tqdm(total=len(closed_prs), desc="Creating issues", unit="issue", ncols=100, bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]') as pbar:
             for pr in closed_prs:
@@ -988,37 +1026,110 @@ class PRMigrationOrchestrator:
         
         print(f"\n🔄 Migrating {len(open_prs)} open PRs...")
         
-        # Progress bar for open PRs migration
-        with tqdm(total=len(open_prs), desc="Migrating PRs", unit="PR", ncols=100, bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]') as pbar:
+        # Counted locally and added to self.stats once the loop is done
+        outcomes = Counter()
+        
+        if not self.dry_run:
+            # Fork and same-branch PRs are rejected without any API call, so record them up
+            # front and keep only the rest for the migration loop
+            migratable_prs = []
             for pr in open_prs:
-                # Update description with current PR
-                pbar.set_postfix_str(f"PR #{pr.id}: {pr.title[:40]}..." if len(pr.title) > 40 else f"PR #{pr.id}: {pr.title}")
-                
-                if self.dry_run:
-                    # Simulate migration without making changes
-                    self.stats['migrated_successfully'] += 1
-                    pbar.update(1)
-                    continue
-                
-                success, error_message = self.github_client.migrate_pull_request(pr)
-                
-                if success:
-                    self.stats['migrated_successfully'] += 1
-                else:
-                    self.stats['migration_failed'] += 1
-                    tqdm.write(f"   ⚠️  Failed: PR #{pr.id} - {error_message}")
+                skip_reason = self.github_client.should_skip(pr)
+                if skip_reason:
+                    self.logger.warning(f"Skipping PR #{pr.id}: {skip_reason}")
+                    outcomes['migration_failed'] += 1
+                    print(f"   ⚠️  Failed: PR #{pr.id} - {skip_reason}")
                     self.pr_logger.log_failed_pr(
                         pr,
-                        reason=error_message or "Migration failed",
+                        reason=skip_reason,
                         error_details=f"Source: {pr.source_branch} -> Destination: {pr.destination_branch}"
                     )
-                
-                pbar.update(1)
+                else:
+                    migratable_prs.append(pr)
+            open_prs = migratable_prs
+        
+        from tqdm import tqdm
+        
+        def describe(pr: PullRequest) -> str:
+            return f"PR #{pr.id}: {pr.title[:40]}..." if len(pr.title) > 40 else f"PR #{pr.id}: {pr.title}"
+        
+        def record(pr: PullRequest, success: bool, error_message: Optional[str]):
+            if success:
+                outcomes['migrated_successfully'] += 1
+            else:
+                outcomes['migration_failed'] += 1
+                tqdm.write(f"   ⚠️  Failed: PR #{pr.id} - {error_message}")
+                self.pr_logger.log_failed_pr(
+                    pr,
+                    reason=error_message or "Migration failed",
+                    error_details=f"Source: {pr.source_branch} -> Destination: {pr.destination_branch}"
+                )
+        
+        # Progress bar for open PRs migration; outcomes reach self.stats even
+        # if the run is interrupted part way
+        try:
+            with tqdm(total=len(open_prs), desc="Migrating PRs", unit="PR", ncols=100, bar_format='{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]') as pbar:
+                if self.dry_run:
+                    for pr in open_prs:
+                        # Simulate migration without making changes
+                        pbar.set_postfix_str(describe(pr))
+                        outcomes['migrated_successfully'] += 1
+                        pbar.update(1)
+                elif self.pr_concurrency == 1:
+                    for pr in open_prs:
+                        pbar.set_postfix_str(describe(pr))
+                        success, error_message = self.github_client.migrate_pull_request(pr)
+                        record(pr, success, error_message)
+                        pbar.update(1)
+                else:
+                    self._migrate_prs_concurrently(open_prs, record, pbar, describe)
+        finally:
+            for key, count in outcomes.items():
+                self.stats[key] += count
         
         print(f"   ✓ Migrated {self.stats['migrated_successfully']} PRs successfully")
         if self.stats['migration_failed'] > 0:
             print(f"   ⚠️  Failed: {self.stats['migration_failed']} PRs")
     
+    def _migrate_prs_concurrently(self, open_prs: List[PullRequest], record, pbar, describe):
+        """
+        Migrate PRs with up to pr_concurrency in flight (opt-in, pr_concurrency > 1)
+        
+        Each PR is dominated by GitHub round trips, so several are migrated at
+        once, at the cost of GitHub numbering them out of Bitbucket order. Only
+        a window of pr_concurrency PRs is submitted at a time, and queued work is
+        cancelled on Ctrl-C or an error, so an interrupted run stops promptly.
+        Results are recorded here on the main thread, so stats and the PR logger
+        need no locking.
+        """
+        pending_prs = iter(open_prs)
+        executor = ThreadPoolExecutor(max_workers=self.pr_concurrency)
+        try:
+            in_flight = {
+                executor.submit(self.github_client.migrate_pull_request, pr): pr
+                for pr in islice(pending_prs, self.pr_concurrency)
+            }
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pr = in_flight.pop(future)
+                    pbar.set_postfix_str(describe(pr))
+                    
+                    try:
+                        success, error_message = future.result()
+                    except Exception as e:
+                        success, error_message = False, f"Unexpected error: {e}"
+                    record(pr, success, error_message)
+                    pbar.update(1)
+                    
+                    next_pr = next(pending_prs, None)
+                    if next_pr is not None:
+                        in_flight[executor.submit(self.github_client.migrate_pull_request, next_pr)] = next_pr
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
+    
     def print_summary(self):
         """Print final migration summary"""
         summary = self.pr_logger.get_summary()
@@ -1204,9 +1315,18 @@ def main():
     if not os.path.exists(args.config):
         create_config_interactive()
     
+    # Parse the config once; logging, the connection test and the
+    # orchestrator all share it
+    config = PRMigrationOrchestrator.load_config(args.config)
+    
     # Setup logging (verbose mode for debugging)
     verbose = os.getenv('VERBOSE', '').lower() in ('true', '1', 'yes')
-    setup_logging(verbose=verbose)
+    logging_config = config.get('logging') or {}
+    setup_logging(
+        log_file=logging_config.get('migration_summary', './logs/migration_summary.log'),
+        verbose=verbose,
+        file_level=logging_config.get('level', 'DEBUG')
+    )
     
     # Show mode indicators
     if args.test_connection:
@@ -1228,7 +1348,7 @@ def main():
     
     # Quick connection test mode
     if args.test_connection:
-        test_credentials(args.config)
+        test_credentials(config)
         return
     
     # Audit mode
@@ -1237,7 +1357,8 @@ def main():
             config_file=args.config,
             dry_run=False,
             test_mode=args.test_mode,
-            pr_numbers=None
+            pr_numbers=None,
+            config=config
         )
         orchestrator.run_audit()
         return
@@ -1257,68 +1378,72 @@ def main():
         config_file=args.config,
         dry_run=args.dry_run,
         test_mode=args.test_mode,
-        pr_numbers=pr_numbers
+        pr_numbers=pr_numbers,
+        config=config
     )
     orchestrator.run()
 
 
-def test_credentials(config_file: str = "config.yaml"):
-    """Test API credentials without full migration"""
-    import yaml
+def test_credentials(config: dict):
+    """
+    Test API credentials without full migration
+    
+    Args:
+        config: Configuration already parsed by main()
+    """
     import requests
-    from github import Github, GithubException
+    from clients import BitbucketClient
     
     logger = logging.getLogger(__name__)
     
     try:
-        # Load config
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config = yaml.safe_load(f)
-        
         logger.info("Testing Bitbucket credentials...")
         # Test Bitbucket
         bb_workspace = config['bitbucket']['workspace']
         bb_repo = config['bitbucket']['repository']
         
-        # Support both OAuth 2.0 and Bearer token
-        headers = {'Accept': 'application/json'}
-        
+        # Support both OAuth 2.0 and Bearer token; the repository is checked
+        # over the client's pooled session
         if 'oauth_key' in config['bitbucket'] and 'oauth_secret' in config['bitbucket']:
             # Use OAuth 2.0 client credentials flow
             oauth_key = config['bitbucket']['oauth_key']
-            oauth_secret = config['bitbucket']['oauth_secret']
             logger.info(f"Using OAuth 2.0 client credentials (key: {oauth_key[:8]}...)")
             
-            # Get access token
-            token_response = requests.post(
-                "https://bitbucket.org/site/oauth2/access_token",
-                auth=(oauth_key, oauth_secret),
-                data={'grant_type': 'client_credentials'}
-            )
-            
-            if token_response.status_code != 200:
-                logger.error(f"❌ Bitbucket: Failed to get OAuth token (status {token_response.status_code})")
+            try:
+                # Request a fresh token rather than trusting the cache, so a wrong
+                # secret fails here; the client then picks up the token just issued
+                BitbucketClient.get_oauth_token(
+                    oauth_key, config['bitbucket']['oauth_secret'], use_cached=False
+                )
+                bitbucket_client = BitbucketClient(
+                    workspace=bb_workspace,
+                    repository=bb_repo,
+                    oauth_key=oauth_key,
+                    oauth_secret=config['bitbucket']['oauth_secret'],
+                    use_cache=False
+                )
+            except requests.exceptions.HTTPError as e:
+                logger.error(f"❌ Bitbucket: Failed to get OAuth token (status {e.response.status_code})")
                 logger.error(f"   Check OAuth consumer credentials at: https://bitbucket.org/{bb_workspace}/workspace/settings/api")
                 return
             
-            token_data = token_response.json()
-            access_token = token_data['access_token']
-            expires_in = token_data.get('expires_in', 7200)
-            logger.info(f"✅ OAuth token obtained (expires in {expires_in} seconds)")
-            headers['Authorization'] = f'Bearer {access_token}'
+            logger.info("✅ OAuth token obtained")
         else:
             # Use Bearer token directly
-            bb_token = config['bitbucket']['token']
-            headers['Authorization'] = f'Bearer {bb_token}'
+            bitbucket_client = BitbucketClient(
+                workspace=bb_workspace,
+                repository=bb_repo,
+                token=config['bitbucket']['token'],
+                use_cache=False
+            )
             logger.info("Using Bearer token authentication")
         
         # Simple API call to test auth
-        test_url = f"https://api.bitbucket.org/2.0/repositories/{bb_workspace}/{bb_repo}"
-        response = requests.get(test_url, headers=headers)
+        status_code = bitbucket_client.get_repository_status()
         
-        if response.status_code == 200:
+        if status_code == 200:
             logger.info(f"✅ Bitbucket: Successfully authenticated to {bb_workspace}/{bb_repo}")
-        elif response.status_code == 401:
+        elif status_code == 401:
             logger.error(f"❌ Bitbucket: Authentication failed (401 Unauthorized)")
             if 'oauth_key' in config['bitbucket'] and 'oauth_secret' in config['bitbucket']:
                 logger.error(f"   OAuth credentials are invalid or lack permissions")
@@ -1327,13 +1452,13 @@ def test_credentials(config_file: str = "config.yaml"):
                 logger.error(f"   Token is invalid or lacks permissions")
                 logger.error(f"   Generate new token: https://bitbucket.org/account/settings/api-tokens/")
             return
-        elif response.status_code == 404:
+        elif status_code == 404:
             logger.error(f"❌ Bitbucket: Repository not found (404)")
             logger.error(f"   Workspace: {bb_workspace}")
             logger.error(f"   Repository: {bb_repo}")
             return
         else:
-            logger.error(f"❌ Bitbucket: Unexpected error (status {response.status_code})")
+            logger.error(f"❌ Bitbucket: Unexpected error (status {status_code})")
             return
         
         logger.info("\nTesting GitHub credentials...")
@@ -1342,7 +1467,7 @@ def test_credentials(config_file: str = "config.yaml"):
         gh_owner = config['github']['owner']
         gh_repo = config['github']['repository']
         
-        from github import Auth
+        from github import Github, Auth, GithubException
         auth = Auth.Token(gh_token)
         github = Github(auth=auth)
         try:
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import List, Optional
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class PRComment:
     """Represents a comment on a pull request"""
     id: int
@@ -35,9 +35,9 @@ class PRComment:
         }
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True, frozen=True)
 class PRReviewer:
-    """Represents a reviewer on a pull request"""
+    """Represents a reviewer on a pull request (immutable, so instances can be shared between PRs)"""
     username: str
     email: Optional[str]
     approval_status: Optional[str] = None  # approved, changes_requested, etc.
@@ -50,7 +50,7 @@ class PRReviewer:
         }
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class PRTask:
     """Represents a task/todo on a pull request"""
     id: int
@@ -79,7 +79,7 @@ class PRTask:
         return self.state == 'RESOLVED'
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class PullRequest:
     """Represents a Pull Request from Bitbucket"""
     id: int
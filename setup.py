@@ -18,8 +18,6 @@ setup(
         "Intended Audience :: Developers",
         "Topic :: Software Development :: Version Control",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Programming Language :: Python :: 3.12",
@@ -30,10 +28,9 @@ setup(
         "requests>=2.31.0",
         "PyGithub>=2.1.1",
         "PyYAML>=6.0.1",
-        "python-dateutil>=2.8.2",
         "tenacity>=8.2.3",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     entry_points={
         "console_scripts": [
             "pr-migrate=main:main",
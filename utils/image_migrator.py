@@ -6,11 +6,16 @@ import logging
 import requests
 import base64
 import os
+import threading
 from typing import Dict, List, Tuple, Optional
 from urllib.parse import urlparse, urljoin, unquote
 
 logger = logging.getLogger(__name__)
 
+# Image references scanned for Bitbucket URLs
+_MARKDOWN_IMAGE_RE = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+_HTML_IMAGE_RE = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']')
+
 
 class ImageMigrator:
     """Handles migration of images from Bitbucket to GitHub"""
@@ -39,6 +44,10 @@ class ImageMigrator:
         # Track migrated images: {original_url: github_url}
         self.image_mapping: Dict[str, str] = {}
         
+        # Per-URL locks so comments migrated concurrently upload each image once
+        self._url_locks: Dict[str, threading.Lock] = {}
+        self._url_locks_guard = threading.Lock()
+        
         # Session for Bitbucket downloads
         self.bitbucket_session = requests.Session()
         self.bitbucket_session.headers.update({
@@ -67,11 +76,11 @@ class ImageMigrator:
             return []
         
         # Pattern: ![alt text](image_url)
-        markdown_images = re.findall(r'!\[([^\]]*)\]\(([^)]+)\)', text)
+        markdown_images = _MARKDOWN_IMAGE_RE.findall(text)
         urls = [url for _, url in markdown_images]
         
         # Also check for HTML img tags
-        html_images = re.findall(r'<img[^>]+src=["\']([^"\']+)["\']', text)
+        html_images = _HTML_IMAGE_RE.findall(text)
         urls.extend(html_images)
         
         # Filter only Bitbucket URLs
@@ -217,9 +226,20 @@ class ImageMigrator:
         """
         # Check if already migrated
         if image_url in self.image_mapping:
-            logger.debug(f"Image already migrated: {image_url}")
+            logger.debug("Image already migrated: %s", image_url)
             return self.image_mapping[image_url]
         
+        with self._url_locks_guard:
+            url_lock = self._url_locks.setdefault(image_url, threading.Lock())
+        
+        with url_lock:
+            # Another thread may have migrated it while we waited
+            if image_url in self.image_mapping:
+                return self.image_mapping[image_url]
+            return self._migrate_image(image_url, pr_number, use_repo_upload)
+    
+    def _migrate_image(self, image_url: str, pr_number: int, use_repo_upload: bool) -> Optional[str]:
+        """Download a single image and upload it to GitHub (caller holds the URL lock)"""
         # Download from Bitbucket
         download_result = self.download_image(image_url)
         if not download_result:
@@ -265,8 +285,8 @@ class ImageMigrator:
         if not text:
             return text
         
-        # Extract all image URLs
-        image_urls = self.extract_image_urls(text)
+        # Extract all image URLs (each distinct URL is migrated once)
+        image_urls = list(dict.fromkeys(self.extract_image_urls(text)))
         
         if not image_urls:
             logger.debug("No Bitbucket images found in text")
@@ -7,6 +7,20 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Bitbucket-only syntax rewritten by _convert_mentions and _convert_bitbucket_specific
+_BRACED_MENTION_RE = re.compile(r'@\{([a-zA-Z0-9_-]+)\}')
+_ATTRIBUTE_RE = re.compile(r'\{:[^}]+\}')
+_COLOR_RE = re.compile(r'\{color:[^}]+\}([^{]+)\{color\}')
+_PANEL_RE = re.compile(r'\{panel(?::title=([^}]+))?\}(.*?)\{panel\}', re.DOTALL)
+_INFO_RE = re.compile(r'\{info\}(.*?)\{info\}', re.DOTALL)
+_TIP_RE = re.compile(r'\{tip\}(.*?)\{tip\}', re.DOTALL)
+_NOTE_RE = re.compile(r'\{note\}(.*?)\{note\}', re.DOTALL)
+_WARNING_RE = re.compile(r'\{warning\}(.*?)\{warning\}', re.DOTALL)
+_CODE_RE = re.compile(r'\{code(?::([^}]+))?\}(.*?)\{code\}', re.DOTALL)
+_QUOTE_RE = re.compile(r'\{quote\}(.*?)\{quote\}', re.DOTALL)
+_ANCHOR_RE = re.compile(r'\{anchor:([^}]+)\}')
+_NOFORMAT_RE = re.compile(r'\{noformat\}(.*?)\{noformat\}', re.DOTALL)
+
 
 class MarkdownConverter:
     """Converts Bitbucket markdown syntax to GitHub-compatible markdown"""
@@ -28,6 +42,10 @@ class MarkdownConverter:
         if not text:
             return ""
         
+        # Nothing below can match without a brace (mentions and macros alike)
+        if '{' not in text:
+            return text
+        
         converted = text
         
         # Convert headings - Bitbucket and GitHub use same syntax (#, ##, ###)
@@ -99,7 +117,7 @@ class MarkdownConverter:
         # with proper user mapping, so we don't convert them here
         
         # Convert @{username} to @username (alphanumeric usernames)
-        text = re.sub(r'@\{([a-zA-Z0-9_-]+)\}', r'@\1', text)
+        text = _BRACED_MENTION_RE.sub(r'@\1', text)
         
         # @username format is already compatible
         
@@ -117,11 +135,11 @@ class MarkdownConverter:
         """
         # Remove Bitbucket markdown attributes (e.g., {: data-layout='center' })
         # These appear after images and other elements
-        text = re.sub(r'\{:[^}]+\}', '', text)
+        text = _ATTRIBUTE_RE.sub('', text)
         
         # Bitbucket color markers (not supported in GitHub)
         # {color:red}text{color} -> **text** (use bold as fallback)
-        text = re.sub(r'\{color:[^}]+\}([^{]+)\{color\}', r'**\1**', text)
+        text = _COLOR_RE.sub(r'**\1**', text)
         
         # Bitbucket panels
         # {panel:title=Title}content{panel} -> ### Title\n> content
@@ -130,14 +148,14 @@ class MarkdownConverter:
             content = match.group(2)
             return f"### {title}\n> {content}"
         
-        text = re.sub(r'\{panel(?::title=([^}]+))?\}(.*?)\{panel\}', convert_panel, text, flags=re.DOTALL)
+        text = _PANEL_RE.sub(convert_panel, text)
         
         # Bitbucket info/tip/note/warning macros
         # {info}text{info} -> > ℹ️ **Info:** text
-        text = re.sub(r'\{info\}(.*?)\{info\}', r'> ℹ️ **Info:** \1', text, flags=re.DOTALL)
-        text = re.sub(r'\{tip\}(.*?)\{tip\}', r'> 💡 **Tip:** \1', text, flags=re.DOTALL)
-        text = re.sub(r'\{note\}(.*?)\{note\}', r'> 📝 **Note:** \1', text, flags=re.DOTALL)
-        text = re.sub(r'\{warning\}(.*?)\{warning\}', r'> ⚠️ **Warning:** \1', text, flags=re.DOTALL)
+        text = _INFO_RE.sub(r'> ℹ️ **Info:** \1', text)
+        text = _TIP_RE.sub(r'> 💡 **Tip:** \1', text)
+        text = _NOTE_RE.sub(r'> 📝 **Note:** \1', text)
+        text = _WARNING_RE.sub(r'> ⚠️ **Warning:** \1', text)
         
         # Bitbucket code macro with language
         # {code:language}text{code} -> ```language\ntext\n```
@@ -146,19 +164,19 @@ class MarkdownConverter:
             code = match.group(2)
             return f"```{lang}\n{code}\n```"
         
-        text = re.sub(r'\{code(?::([^}]+))?\}(.*?)\{code\}', convert_code_macro, text, flags=re.DOTALL)
+        text = _CODE_RE.sub(convert_code_macro, text)
         
         # Bitbucket quote macro
         # {quote}text{quote} -> > text
-        text = re.sub(r'\{quote\}(.*?)\{quote\}', r'> \1', text, flags=re.DOTALL)
+        text = _QUOTE_RE.sub(r'> \1', text)
         
         # Bitbucket anchor links
         # {anchor:name} -> <a id="name"></a>
-        text = re.sub(r'\{anchor:([^}]+)\}', r'<a id="\1"></a>', text)
+        text = _ANCHOR_RE.sub(r'<a id="\1"></a>', text)
         
         # Bitbucket noformat (preformatted text)
         # {noformat}text{noformat} -> ```\ntext\n```
-        text = re.sub(r'\{noformat\}(.*?)\{noformat\}', r'```\n\1\n```', text, flags=re.DOTALL)
+        text = _NOFORMAT_RE.sub(r'```\n\1\n```', text)
         
         return text
     
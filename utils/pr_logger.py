@@ -40,9 +40,13 @@ class PRLogger:
     
     def _initialize_file(self, filepath: str):
         """Initialize JSON file if it doesn't exist"""
-        if not os.path.exists(filepath):
-            with open(filepath, 'w', encoding='utf-8') as f:
+        # Exclusive create: one open() instead of a stat() then open(), and no
+        # window for another run to create the file in between
+        try:
+            with open(filepath, 'x', encoding='utf-8') as f:
                 json.dump([], f)
+        except FileExistsError:
+            pass
     
     def log_closed_pr(self, pr: PullRequest):
         """
@@ -52,36 +56,66 @@ class PRLogger:
         Args:
             pr: PullRequest object to log
         """
+        self.log_closed_prs([pr])
+    
+    def log_closed_prs(self, prs: List[PullRequest]):
+        """
+        Log closed PRs that were not migrated, reading and rewriting the
+        archive once for the whole batch instead of once per PR
+        
+        Args:
+            prs: PullRequest objects to log
+        """
+        if not prs:
+            return
+        
         try:
-            # Determine PR status type
-            if pr.is_merged():
-                pr_status = "MERGED"
-            elif pr.is_declined():
-                pr_status = "DECLINED"
-            elif pr.is_superseded():
-                pr_status = "SUPERSEDED"
-            else:
-                pr_status = pr.state
-            
             # Read existing data
             with open(self.closed_pr_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
+        except Exception as e:
+            self.logger.error(f"Failed to log {len(prs)} closed PR(s): {e}")
+            return
+        
+        logged = []
+        logged_at = datetime.now().isoformat()
+        for pr in prs:
+            try:
+                # Determine PR status type
+                if pr.is_merged():
+                    pr_status = "MERGED"
+                elif pr.is_declined():
+                    pr_status = "DECLINED"
+                elif pr.is_superseded():
+                    pr_status = "SUPERSEDED"
+                else:
+                    pr_status = pr.state
+                
+                # Append new PR with comprehensive details
+                pr_data = pr.to_dict()
+                # Remove fork-related fields for closed PRs
+                pr_data.pop('is_fork', None)
+                pr_data.pop('fork_repo_owner', None)
+                pr_data.pop('fork_repo_name', None)
+                pr_data['status'] = pr_status
+                pr_data['logged_at'] = logged_at
+                pr_data['reason_not_migrated'] = f"PR is {pr_status} - Only OPEN PRs are migrated"
+                data.append(pr_data)
+                logged.append((pr, pr_status))
             
-            # Append new PR with comprehensive details
-            pr_data = pr.to_dict()
-            # Remove fork-related fields for closed PRs
-            pr_data.pop('is_fork', None)
-            pr_data.pop('fork_repo_owner', None)
-            pr_data.pop('fork_repo_name', None)
-            pr_data['status'] = pr_status
-            pr_data['logged_at'] = datetime.now().isoformat()
-            pr_data['reason_not_migrated'] = f"PR is {pr_status} - Only OPEN PRs are migrated"
-            data.append(pr_data)
-            
+            except Exception as e:
+                self.logger.error(f"Failed to log closed PR #{pr.id}: {e}")
+        
+        try:
             # Write back
             with open(self.closed_pr_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
-            
+        except Exception as e:
+            self.logger.error(f"Failed to log {len(logged)} closed PR(s): {e}")
+            return
+        
+        archive_name = os.path.basename(self.closed_pr_file)
+        for pr, pr_status in logged:
             # Update session stats
             if pr_status == "MERGED":
                 self.session_stats['merged_count'] += 1
@@ -90,10 +124,7 @@ class PRLogger:
             elif pr_status == "SUPERSEDED":
                 self.session_stats['superseded_count'] += 1
             
-            self.logger.info(f"Logged {pr_status} PR #{pr.id}: {pr.title} to {os.path.basename(self.closed_pr_file)}")
-        
-        except Exception as e:
-            self.logger.error(f"Failed to log closed PR #{pr.id}: {e}")
+            self.logger.info("Logged %s PR #%s: %s to %s", pr_status, pr.id, pr.title, archive_name)
     
     def log_failed_pr(self, pr: PullRequest, reason: str, error_details: str = ""):
         """
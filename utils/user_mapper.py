@@ -5,6 +5,11 @@ import yaml
 import logging
 from typing import Optional, Dict
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,13 +20,17 @@ class UserMapper:
         self.mapping_file = mapping_file
         self.mapping: Dict[str, str] = {}
         self.warned_users: set = set()  # Track users we've already warned about
+        # Lower-cased key index and per-identifier results; the mapping does
+        # not change during a run, so each identifier is resolved once
+        self._case_insensitive: Dict[str, str] = {}
+        self._resolved: Dict[str, Optional[str]] = {}
         self.load_mapping()
     
     def load_mapping(self):
         """Load user mapping from YAML file"""
         try:
             with open(self.mapping_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
+                data = yaml.load(f, Loader=YamlLoader)
                 if data:
                     self.mapping = data
                     logger.info(f"Loaded {len(self.mapping)} user mappings from {self.mapping_file}")
@@ -33,6 +42,12 @@ class UserMapper:
         except Exception as e:
             logger.error(f"Error loading user mapping: {e}")
             self.mapping = {}
+        
+        self._case_insensitive = {}
+        for bb_key, gh_value in self.mapping.items():
+            # Keys that differ only by case resolve to the first one in the file
+            self._case_insensitive.setdefault(str(bb_key).lower(), gh_value)
+        self._resolved = {}
     
     def get_github_user(self, bitbucket_identifier: str) -> Optional[str]:
         """
@@ -47,25 +62,36 @@ class UserMapper:
         if not bitbucket_identifier:
             return None
         
+        try:
+            return self._resolved[bitbucket_identifier]
+        except KeyError:
+            pass
+        
+        github_user = self._resolve(bitbucket_identifier)
+        self._resolved[bitbucket_identifier] = github_user
+        return github_user
+    
+    def _resolve(self, bitbucket_identifier: str) -> Optional[str]:
+        """Look up a single identifier in the mapping (uncached)"""
         # Clean identifier (remove Bitbucket account_id format if present)
         # Account IDs look like: "712020:634d5063-6091-4f3c-8b08-64ccd298144d"
         clean_identifier = bitbucket_identifier
         if ':' in bitbucket_identifier and len(bitbucket_identifier) > 20:
             # This looks like an account_id, skip mapping attempt
-            logger.debug(f"Skipping mapping for account_id: {bitbucket_identifier[:20]}...")
+            logger.debug("Skipping mapping for account_id: %.20s...", bitbucket_identifier)
             return None
             
         # Try direct username lookup
         if clean_identifier in self.mapping:
             github_user = self.mapping[clean_identifier]
-            logger.debug(f"Mapped {clean_identifier} -> {github_user}")
+            logger.debug("Mapped %s -> %s", clean_identifier, github_user)
             return github_user
         
         # Try case-insensitive lookup
-        for bb_key, gh_value in self.mapping.items():
-            if bb_key.lower() == clean_identifier.lower():
-                logger.debug(f"Mapped (case-insensitive) {clean_identifier} -> {gh_value}")
-                return gh_value
+        gh_value = self._case_insensitive.get(clean_identifier.lower())
+        if gh_value is not None:
+            logger.debug("Mapped (case-insensitive) %s -> %s", clean_identifier, gh_value)
+            return gh_value
         
         # Only warn once per unique user (avoid spam)
         if clean_identifier not in self.warned_users: